@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""Generate a synthetic corpus of Claude Code session JSONL files.
+
+Usage:
+    generate-corpus.py OUTPUT_DIR [--sessions N] [--projects N] [--msgs MIN-MAX]
+                       [--days N] [--tool-mix Read=4,Bash=3,...] [--big-rate 0.05]
+                       [--big-kb 512] [--vault PATH] [--seed N]
+
+Writes OUTPUT_DIR/<encoded-project>/<sessionId>.jsonl laid out like
+~/.claude/projects, so it can be scanned by pointing HOME at a directory
+whose .claude/projects is OUTPUT_DIR, or by passing files directly to the
+extractors. Records mirror the real format: summary lines, user turns
+(including system-reminder noise and slash commands), assistant turns with
+text and tool_use blocks, and tool_result user turns with toolUseResult.
+A fraction of tool results are oversized to model multi-MB transcripts.
+
+File mtimes are set to the last record timestamp, as Claude Code leaves them.
+"""
+
+import argparse
+import json
+import os
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+DEFAULT_TOOL_MIX = "Read=4,Bash=3,Edit=2,Grep=1,Glob=1,Write=1,Skill=0.2"
+
+USER_PROMPTS = [
+    "Fix the failing test in the auth module",
+    "Summarize yesterday's meeting notes and draft follow-ups",
+    "Refactor the dashboard query so it runs under a second",
+    "## Continue: QMD video outline\n\nPick up from section 3",
+    "Why does the sync hook fire twice on session end?",
+    "Add a weekly review template to the vault",
+    "Research embedding chunk sizes for long transcripts",
+    "Clean up the large files in Downloads",
+]
+
+VAULT_FILES = [
+    "Notes/Projects/recall.md",
+    "Notes/Research/embeddings.md",
+    "Notes/Plans/q3-plan.md",
+    "Notes/Content/qmd-video.md",
+    "Daily/2026-02-20.md",
+    ".claude/skills/recall/SKILL.md",
+    "Templates/weekly-review.md",
+    "CLAUDE.md",
+]
+
+
+def parse_tool_mix(spec: str) -> tuple[list[str], list[float]]:
+    """Parse 'Read=4,Bash=3' into parallel name/weight lists."""
+    names, weights = [], []
+    for part in spec.split(','):
+        name, _, weight = part.partition('=')
+        names.append(name.strip())
+        weights.append(float(weight or 1))
+    return names, weights
+
+
+def new_uuid(rng: random.Random) -> str:
+    """Seeded UUID4, so a corpus is reproducible from its seed."""
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def iso(dt: datetime) -> str:
+    return dt.strftime('%Y-%m-%dT%H:%M:%S.') + f"{dt.microsecond // 1000:03d}Z"
+
+
+def tool_call(rng: random.Random, tool: str, vault: str) -> tuple[dict, dict | None]:
+    """Return (tool_use input, toolUseResult) for one tool call."""
+    path = vault + rng.choice(VAULT_FILES)
+    if tool == 'Read':
+        return {'file_path': path}, {'type': 'text', 'file': {'filePath': path}}
+    if tool == 'Edit':
+        return ({'file_path': path, 'old_string': 'foo', 'new_string': 'bar'},
+                {'filePath': path, 'oldString': 'foo', 'structuredPatch': [{'lines': ['-foo', '+bar']}]})
+    if tool == 'Write':
+        return {'file_path': path, 'content': 'x' * 200}, {'type': 'create', 'filePath': path}
+    if tool in ('Grep', 'Glob'):
+        return {'pattern': 'TODO', 'path': vault + 'Notes/'}, None
+    if tool == 'Skill':
+        return {'skill': rng.choice(['recall', 'tasknotes', 'granola'])}, None
+    # Bash: sometimes a large heredoc script that never mentions the vault
+    if rng.random() < 0.2:
+        cmd = "python3 - <<'EOF'\n" + "print('step')\n" * rng.randint(50, 2000) + "EOF"
+    else:
+        cmd = f'cat "{path}" | head -50 && ls {vault}Notes/'
+    return {'command': cmd, 'description': 'Run command'}, {'stdout': 'ok', 'stderr': ''}
+
+
+def generate_session(rng: random.Random, proj_dir: Path, start: datetime, n_msgs: int,
+                     tools: tuple[list[str], list[float]], big_rate: float, big_kb: int,
+                     vault: str, cwd: str) -> str:
+    """Write proj_dir/<sessionId>.jsonl, set its mtime to the last timestamp, return the id."""
+    session_id = new_uuid(rng)
+    base = {
+        'parentUuid': None, 'isSidechain': False, 'userType': 'external', 'cwd': cwd,
+        'sessionId': session_id, 'version': '2.1.0', 'gitBranch': 'main',
+    }
+    ts = start
+    lines = [json.dumps({'type': 'summary', 'summary': 'Synthetic session', 'leafUuid': new_uuid(rng)})]
+
+    def record(rec_type: str, message: dict, **extra) -> str:
+        rec = {**base, 'type': rec_type, 'message': message, 'uuid': new_uuid(rng), 'timestamp': iso(ts)}
+        rec.update(extra)
+        return json.dumps(rec, separators=(',', ':'))
+
+    for i in range(n_msgs):
+        ts += timedelta(seconds=rng.randint(20, 900))
+        roll = rng.random()
+        if roll < 0.1:
+            content = '/clear'
+        elif roll < 0.3:
+            content = f"<system-reminder>Context {i}</system-reminder>\n{rng.choice(USER_PROMPTS)}"
+        else:
+            content = rng.choice(USER_PROMPTS) + f" (step {i})"
+        lines.append(record('user', {'role': 'user', 'content': content}))
+
+        for _ in range(rng.randint(0, 4)):
+            ts += timedelta(seconds=rng.randint(1, 60))
+            tool = rng.choices(*tools)[0]
+            tool_id = f"toolu_{rng.getrandbits(64):016x}"
+            tool_input, tool_result = tool_call(rng, tool, vault)
+            lines.append(record('assistant', {
+                'role': 'assistant', 'model': 'claude-synthetic',
+                'content': [
+                    {'type': 'text', 'text': f"Looking at {tool.lower()} output.\nDetails follow."},
+                    {'type': 'tool_use', 'id': tool_id, 'name': tool, 'input': tool_input},
+                ],
+            }))
+            size = big_kb * 1024 if rng.random() < big_rate else rng.randint(200, 8000)
+            extra = {'toolUseResult': tool_result} if tool_result else {}
+            lines.append(record('user', {
+                'role': 'user',
+                'content': [{'type': 'tool_result', 'tool_use_id': tool_id, 'content': 'r' * size}],
+            }, **extra))
+
+        ts += timedelta(seconds=rng.randint(5, 120))
+        lines.append(record('assistant', {
+            'role': 'assistant', 'model': 'claude-synthetic',
+            'content': [{'type': 'text', 'text': 'Done. ' * rng.randint(5, 200)}],
+        }))
+
+    path = proj_dir / f"{session_id}.jsonl"
+    path.write_text('\n'.join(lines) + '\n')
+    mtime = ts.timestamp()
+    os.utime(path, (mtime, mtime))
+    return session_id
+
+
+def generate_corpus(output: Path, sessions: int = 100, projects: int = 5, msgs: tuple[int, int] = (3, 40),
+                    days: int = 30, tool_mix: str = DEFAULT_TOOL_MIX, big_rate: float = 0.05,
+                    big_kb: int = 512, vault: str = "/Users/me/vault/", seed: int = 0) -> list[Path]:
+    """Generate a corpus and return the session file paths."""
+    rng = random.Random(seed)
+    tools = parse_tool_mix(tool_mix)
+    now = datetime.now(timezone.utc)
+    project_dirs = []
+    for p in range(projects):
+        cwd = f"{vault.rstrip('/')}-project-{p}" if p else vault.rstrip('/')
+        d = output / cwd.replace('/', '-')
+        d.mkdir(parents=True, exist_ok=True)
+        project_dirs.append((d, cwd))
+
+    files = []
+    for _ in range(sessions):
+        proj_dir, cwd = rng.choice(project_dirs)
+        start = now - timedelta(days=rng.uniform(0, days))
+        session_id = generate_session(rng, proj_dir, start, rng.randint(*msgs), tools, big_rate, big_kb, vault, cwd)
+        files.append(proj_dir / f"{session_id}.jsonl")
+    return files
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Generate synthetic Claude Code session JSONL files',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument('output', help='Output directory (acts as ~/.claude/projects)')
+    parser.add_argument('--sessions', type=int, default=100, help='Number of sessions (default: 100)')
+    parser.add_argument('--projects', type=int, default=5, help='Number of project directories (default: 5)')
+    parser.add_argument('--msgs', default='3-40', help='User messages per session, MIN-MAX (default: 3-40)')
+    parser.add_argument('--days', type=int, default=30, help='Spread session starts over N days (default: 30)')
+    parser.add_argument('--tool-mix', default=DEFAULT_TOOL_MIX, help=f'Tool weights (default: {DEFAULT_TOOL_MIX})')
+    parser.add_argument('--big-rate', type=float, default=0.05, help='Fraction of oversized tool results (default: 0.05)')
+    parser.add_argument('--big-kb', type=int, default=512, help='Oversized tool result size in KB (default: 512)')
+    parser.add_argument('--vault', default='/Users/me/vault/', help='Vault prefix used in file paths')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    args = parser.parse_args()
+
+    lo, _, hi = args.msgs.partition('-')
+    msgs = (int(lo), int(hi or lo))
+    vault = args.vault if args.vault.endswith('/') else args.vault + '/'
+
+    files = generate_corpus(Path(args.output), args.sessions, args.projects, msgs, args.days,
+                            args.tool_mix, args.big_rate, args.big_kb, vault, args.seed)
+    total = sum(f.stat().st_size for f in files)
+    print(f"Generated {len(files)} sessions ({total / (1024 * 1024):.1f}MB) in {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""Benchmark the recall and session-sync JSONL readers on synthetic corpora.
+
+Usage:
+    run-bench.py [--sizes 100,1000,10000] [--msgs 2-12] [--big-rate 0.01]
+                 [--big-kb 256] [--workdir DIR] [--keep] [--only NAME,...]
+
+For each corpus size, generates sessions with generate-corpus.py (reused
+across runs when --workdir already holds a corpus of that size) and times:
+
+    scan_session_metadata   recall-day.py, no index
+    scan_sessions:cold      recall-day.py, empty SQLite index
+    scan_sessions:warm      recall-day.py, fully populated index
+    extract_session         extract-sessions.py
+    extract_file_paths      session-graph.py (skipped without networkx/pyvis)
+    extract_session_data    claude-sessions (parse_jsonl + extract)
+
+Each row reports wall time, sessions/s and MB/s over the whole corpus.
+The 10k corpus takes roughly 1GB of disk with the default shape.
+"""
+
+import argparse
+import importlib.machinery
+import importlib.util
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).parent
+SCRIPTS_DIR = BENCH_DIR.parent / "scripts"
+SYNC_SCRIPT = BENCH_DIR.parent.parent / "sync-claude-sessions" / "scripts" / "claude-sessions"
+VAULT = "/Users/bench/vault/"
+
+# session-graph.py reads VAULT_DIR at import time
+os.environ.setdefault("VAULT_DIR", VAULT)
+
+
+def load_module(name: str, path: Path):
+    """Import a script by path (hyphenated names can't be imported normally)."""
+    loader = importlib.machinery.SourceFileLoader(name, str(path))
+    spec = importlib.util.spec_from_loader(name, loader)
+    module = importlib.util.module_from_spec(spec)
+    loader.exec_module(module)
+    return module
+
+
+def corpus_files(root: Path) -> list[Path]:
+    return sorted(root.glob("*/*.jsonl"))
+
+
+def build_benchmarks() -> dict:
+    """Map benchmark name -> callable(files, workdir). Missing deps are skipped."""
+    recall_day = load_module("recall_day", SCRIPTS_DIR / "recall-day.py")
+    print(f"JSON backend: {recall_day.JSON_BACKEND} (set RECALL_JSON=json|orjson|msgspec to compare)")
+    extract_sessions = load_module("extract_sessions", SCRIPTS_DIR / "extract-sessions.py")
+    date_start = datetime.now(timezone.utc) - timedelta(days=365)
+    date_end = datetime.now(timezone.utc) + timedelta(days=1)
+
+    def scan_metadata(files, workdir):
+        for fp in files:
+            recall_day.scan_session_metadata(fp, date_start, date_end)
+
+    def scan_cold(files, workdir):
+        db = workdir / "bench-index.db"
+        db.unlink(missing_ok=True)
+        index = recall_day.SessionIndex(db)
+        recall_day.scan_sessions(files, date_start, date_end, index)
+        index.close()
+
+    def scan_warm(files, workdir):
+        db = workdir / "bench-index.db"
+        if not db.exists():
+            scan_cold(files, workdir)
+        index = recall_day.SessionIndex(db)
+        recall_day.scan_sessions(files, date_start, date_end, index)
+        index.close()
+
+    def extract_session(files, workdir):
+        for fp in files:
+            extract_sessions.extract_session(str(fp))
+
+    benchmarks = {
+        'scan_session_metadata': scan_metadata,
+        'scan_sessions:cold': scan_cold,
+        'scan_sessions:warm': scan_warm,
+        'extract_session': extract_session,
+    }
+
+    try:
+        session_graph = load_module("session_graph", SCRIPTS_DIR / "session-graph.py")
+    except ImportError as e:
+        print(f"Skipping extract_file_paths: {e}", file=sys.stderr)
+    else:
+        def extract_file_paths(files, workdir):
+            for fp in files:
+                session_graph.extract_file_paths(fp)
+        benchmarks['extract_file_paths'] = extract_file_paths
+
+    if SYNC_SCRIPT.exists():
+        claude_sessions = load_module("claude_sessions", SYNC_SCRIPT)
+
+        def extract_session_data(files, workdir):
+            for fp in files:
+                claude_sessions.extract_session_data(claude_sessions.parse_jsonl(fp))
+        benchmarks['extract_session_data'] = extract_session_data
+
+    return benchmarks
+
+
+def run(benchmarks: dict, files: list[Path], workdir: Path) -> list[tuple[str, float]]:
+    results = []
+    for name, fn in benchmarks.items():
+        t0 = time.perf_counter()
+        fn(files, workdir)
+        results.append((name, time.perf_counter() - t0))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark recall JSONL readers on synthetic corpora',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument('--sizes', default='100,1000,10000', help='Corpus sizes in sessions (default: 100,1000,10000)')
+    parser.add_argument('--msgs', default='2-12', help='User messages per session, MIN-MAX (default: 2-12)')
+    parser.add_argument('--big-rate', type=float, default=0.01, help='Fraction of oversized tool results (default: 0.01)')
+    parser.add_argument('--big-kb', type=int, default=256, help='Oversized tool result size in KB (default: 256)')
+    parser.add_argument('--workdir', default=None, help='Where to keep corpora (default: temp dir)')
+    parser.add_argument('--keep', action='store_true', help='Keep generated corpora')
+    parser.add_argument('--only', default=None, help='Comma-separated benchmark names to run')
+    args = parser.parse_args()
+
+    gen = load_module("generate_corpus", BENCH_DIR / "generate-corpus.py")
+    benchmarks = build_benchmarks()
+    if args.only:
+        wanted = set(args.only.split(','))
+        benchmarks = {k: v for k, v in benchmarks.items() if k in wanted}
+
+    workdir = Path(args.workdir) if args.workdir else Path(tempfile.mkdtemp(prefix="recall-bench-"))
+    workdir.mkdir(parents=True, exist_ok=True)
+    lo, _, hi = args.msgs.partition('-')
+
+    print(f"{'Benchmark':24}  {'Sessions':>8}  {'MB':>8}  {'Seconds':>8}  {'Sess/s':>9}  {'MB/s':>8}")
+    print(f"{'-' * 24}  {'-' * 8}  {'-' * 8}  {'-' * 8}  {'-' * 9}  {'-' * 8}")
+    try:
+        for size in (int(s) for s in args.sizes.split(',')):
+            root = workdir / f"corpus-{size}"
+            files = corpus_files(root)
+            if len(files) != size:
+                shutil.rmtree(root, ignore_errors=True)
+                files = gen.generate_corpus(root, sessions=size, msgs=(int(lo), int(hi or lo)),
+                                            big_rate=args.big_rate, big_kb=args.big_kb, vault=VAULT)
+            mb = sum(f.stat().st_size for f in files) / (1024 * 1024)
+            for name, secs in run(benchmarks, files, workdir):
+                print(f"{name:24}  {size:8}  {mb:8.1f}  {secs:8.2f}  {size / secs:9.0f}  {mb / secs:8.1f}", flush=True)
+    finally:
+        if not args.keep and not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -2,7 +2,8 @@
 """Extract user messages from Claude Code session logs into QMD-friendly markdown.
 
 Usage:
-    python3 extract-sessions.py [--days 21] [--source DIR] [--output DIR]
+    python3 extract-sessions.py [--days 21] [--source DIR] [--output DIR] [--full] [--jobs N]
+                                [--max-chars-per-file N] [--split-by hour]
 
 Extracts only YOUR messages from Claude Code JSONL session logs.
 Strips system tags, slash commands, and agent noise.
@@ -12,6 +13,40 @@ Output files are named: YYYY-MM-DD-HHMM-{session_id_short}.md
 Each file has frontmatter (date, session_id, title, type, messages count)
 and each user message as its own ## section with timestamp.
 
+Runs are incremental: a manifest in the output directory (.extract-manifest.json)
+records each source file's inode, size, mtime and the byte offset read so far.
+Unchanged sessions are skipped, and sessions that grew are resumed from the
+stored offset, so only their new messages are appended to the existing
+markdown. --full ignores the manifest and re-extracts everything.
+
+--max-chars-per-file N and --split-by hour cut long sessions into part files
+at message boundaries: <session>-p2.md, -p3.md, ..., each linking back to
+the first. Growth only touches the last part or adds new ones. The split
+settings are recorded per session in the manifest, and a session written
+with different ones is re-extracted in full on the next run.
+
+Files are only rewritten when their content changes (temp file + rename),
+so a re-run that finds nothing new leaves every mtime alone and gives QMD
+and Obsidian nothing to re-index.
+
+Resumed and forked sessions replay earlier user messages. A session whose
+leading messages (same timestamp and text) were already written for an
+earlier session starts with a link to that session instead of a copy, so
+the text is stored and embedded once. A session made only of replayed
+messages gets no file. Message hashes live in the manifest for sessions in
+the --days window; --no-dedup writes every session in full.
+
+Extracted messages are also kept in a SQLite FTS5 index (the recall skill's
+cache/messages.db, or --index PATH) for `recall-day.py search`. An empty or
+missing index triggers a one-off full pass to fill it; --no-index skips it.
+
+Sessions are parsed across --jobs worker processes (default: CPU count) when
+there are enough to pay for starting them, and written by the main process
+in sorted order, so output matches a serial run.
+Sessions of --stream-above MB or more never sit in memory whole: workers
+spool their messages to a hidden file in the output directory, and the
+markdown is streamed from there, header last.
+
 After running, add as QMD collection:
     qmd collection add /path/to/output --name sessions
     qmd update && qmd embed
@@ -19,12 +54,25 @@ After running, add as QMD collection:
 
 import json
 import glob
+import hashlib
+import itertools
 import os
 import re
+import sqlite3
 import argparse
+import tempfile
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 
+# Import recall-day as module (shared JSON decoder backend)
+import importlib.util
+spec = importlib.util.spec_from_file_location("recall_day", Path(__file__).parent / "recall-day.py")
+recall_day = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(recall_day)
+
 def _detect_default_source():
     """Auto-detect Claude project directory from CWD."""
     cwd = os.getcwd()
@@ -56,6 +104,17 @@ def _detect_default_output():
 DEFAULT_SOURCE = _detect_default_source()
 DEFAULT_OUTPUT = _detect_default_output()
 DEFAULT_DAYS = 21
+MANIFEST_NAME = ".extract-manifest.json"
+DEFAULT_JOBS = os.cpu_count() or 1
+# Sessions at least this big (MB) are spooled to disk instead of held in memory
+DEFAULT_STREAM_ABOVE = 32
+# Markdown body kept in memory before the spool rolls over to a temp file
+SPOOL_MEMORY = 1024 * 1024
+COPY_CHUNK = 1024 * 1024
+# Split settings of manifest entries that don't record theirs
+NO_SPLIT = {'max_chars': 0, 'split_by': 'none'}
+
+decode_record = recall_day.record_decoder('sessionId', 'type', 'message', 'timestamp')
 
 # Patterns to strip from user messages
 STRIP_PATTERNS = [
@@ -73,9 +132,15 @@ def clean_content(text: str) -> str:
     for pat in STRIP_PATTERNS:
         text = re.sub(pat, '', text, flags=re.DOTALL)
     text = text.strip()
+    # json.loads keeps lone surrogate escapes, which can't be written as UTF-8
+    if not text.isascii():
+        text = text.encode('utf-8', 'replace').decode('utf-8')
     return text
 
 
+UNTITLED = "Untitled session"
+
+
 def derive_title(messages: list[dict]) -> str:
     """Derive a short title from the first meaningful user message."""
     for msg in messages:
@@ -99,24 +164,51 @@ def derive_title(messages: list[dict]) -> str:
             first_line = first_line[:77] + '...'
         if len(first_line) >= 5:
             return first_line
-    return "Untitled session"
+    return UNTITLED
 
 
-def extract_session(filepath: str) -> dict | None:
-    """Extract user messages from a single JSONL session file."""
-    messages = []
+def parse_timestamp(ts_str: str) -> datetime | None:
+    try:
+        return datetime.fromisoformat(ts_str.replace('Z', '+00:00'))
+    except (AttributeError, ValueError):
+        return None
+
+
+def iter_user_messages(filepath: str, start: int = 0, cutoff: datetime | None = None,
+                       info: dict | None = None) -> Iterator[dict]:
+    """Yield user messages from a JSONL session file, starting at byte offset start.
+
+    Fills info with 'session_id' and 'offset', the position after the last
+    complete record, so a growing session can be resumed from there. A last
+    line without a newline counts as complete if it parses.
+
+    With a cutoff, reading stops at the first timestamped message if it is
+    older than the cutoff - the session will be discarded anyway, so only
+    its head is read.
+    """
+    info = {} if info is None else info
     session_id = None
-    first_ts = None
+    offset = start
+    check_cutoff = cutoff is not None
 
-    with open(filepath) as f:
+    with open(filepath, 'rb') as f:
+        f.seek(start)
         for line in f:
             try:
-                obj = json.loads(line)
-            except json.JSONDecodeError:
+                obj = decode_record(line)
+            except recall_day.DECODE_ERRORS:
+                # A last line that doesn't parse is still being written -
+                # stop before it
+                if not line.endswith(b'\n'):
+                    break
+                obj = None
+            offset += len(line)
+            info['offset'] = offset
+            if obj is None:
                 continue
 
             if not session_id and obj.get('sessionId'):
-                session_id = obj['sessionId']
+                session_id = info['session_id'] = obj['sessionId']
 
             if obj.get('type') != 'user':
                 continue
@@ -134,25 +226,90 @@ def extract_session(filepath: str) -> dict | None:
             if re.match(r'^/\w+\s*$', cleaned):
                 continue
 
-            if not first_ts and timestamp:
-                first_ts = timestamp
-
-            messages.append({
+            yield {
                 'content': cleaned,
                 'timestamp': timestamp,
-            })
+            }
 
-    if not messages:
-        return None
+            if check_cutoff and timestamp:
+                check_cutoff = False
+                dt = parse_timestamp(timestamp)
+                if dt and dt < cutoff:
+                    break
+
+
+def read_user_messages(filepath: str, start: int = 0,
+                       cutoff: datetime | None = None) -> tuple[list[dict], str | None, int]:
+    """List form of iter_user_messages: (messages, session_id, offset)."""
+    info = {'session_id': None, 'offset': start}
+    messages = list(iter_user_messages(filepath, start, cutoff, info))
+    return messages, info['session_id'], info['offset']
+
+
+def extract_session(filepath: str, cutoff: datetime | None = None, spool: str | None = None) -> dict | None:
+    """Extract user messages from a single JSONL session file.
+
+    Sessions that started before the cutoff come back with 'stale' set and
+    only their head read (see iter_user_messages).
+
+    With spool, messages are streamed to that file as JSON lines instead of
+    kept in 'messages', so memory stays flat on huge transcripts; read them
+    back with session_messages(). Either way the result carries the message
+    count, first/last timestamps and per-message hashes.
+    """
+    info = {'session_id': None, 'offset': 0}
+    messages = [] if spool is None else None
+    hashes = []
+    first_ts = None
+    last_ts = ''
+    out = open(spool, 'w') if spool else None
+    try:
+        for msg in iter_user_messages(filepath, cutoff=cutoff, info=info):
+            hashes.append(message_hash(msg))
+            if first_ts is None and msg['timestamp']:
+                first_ts = msg['timestamp']
+            last_ts = msg['timestamp']
+            if out is not None:
+                out.write(json.dumps(msg) + '\n')
+            else:
+                messages.append(msg)
+    finally:
+        if out is not None:
+            out.close()
+
+    first_dt = parse_timestamp(first_ts) if first_ts else None
+    stale = bool(cutoff and first_dt and first_dt < cutoff)
+    if not hashes or stale:
+        if spool:
+            os.remove(spool)
+            spool = None
+        if not hashes:
+            return None
 
     return {
-        'session_id': session_id or Path(filepath).stem,
+        'session_id': info['session_id'] or Path(filepath).stem,
         'first_ts': first_ts,
+        'last_ts': last_ts,
+        'count': len(hashes),
+        'hashes': hashes,
         'messages': messages,
+        'spool': spool,
         'filepath': filepath,
+        'offset': info['offset'],
+        'stale': stale,
     }
 
 
+def session_messages(session: dict, skip: int = 0) -> Iterator[dict]:
+    """A session's messages from memory or its spool file, after the first skip."""
+    if session['messages'] is not None:
+        yield from session['messages'][skip:]
+        return
+    with open(session['spool']) as f:
+        for line in itertools.islice(f, skip, None):
+            yield json.loads(line)
+
+
 def format_timestamp(ts_str: str) -> str:
     """Parse ISO timestamp to readable format."""
     try:
@@ -162,8 +319,8 @@ def format_timestamp(ts_str: str) -> str:
         return ''
 
 
-def write_session_md(session: dict, output_dir: str) -> str:
-    """Write a session's user messages as structured markdown."""
+def session_md_path(session: dict, output_dir: str) -> str:
+    """Output path for a session: YYYY-MM-DD-HHMM-{session_id_short}.md"""
     ts = session['first_ts']
     try:
         dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
@@ -173,24 +330,14 @@ def write_session_md(session: dict, output_dir: str) -> str:
         date_str = 'unknown'
         time_str = '0000'
 
-    title = derive_title(session['messages'])
     sid_short = session['session_id'][:8]
-    filename = f"{date_str}-{time_str}-{sid_short}.md"
-    filepath = os.path.join(output_dir, filename)
+    return os.path.join(output_dir, f"{date_str}-{time_str}-{sid_short}.md")
 
-    lines = []
-    lines.append('---')
-    lines.append(f'date: {date_str}')
-    lines.append(f'session_id: {session["session_id"]}')
-    lines.append(f'title: "{title}"')
-    lines.append(f'type: session-log')
-    lines.append(f'messages: {len(session["messages"])}')
-    lines.append('---')
-    lines.append('')
-    lines.append(f'# {title}')
-    lines.append('')
 
-    for msg in session['messages']:
+def message_lines(messages: list[dict]) -> list[str]:
+    """Markdown lines for user messages, one ## section per message."""
+    lines = []
+    for msg in messages:
         ts_label = format_timestamp(msg['timestamp'])
         if ts_label:
             lines.append(f'## {ts_label}')
@@ -199,11 +346,391 @@ def write_session_md(session: dict, output_dir: str) -> str:
         lines.append('')
         lines.append(msg['content'])
         lines.append('')
+    return lines
+
+
+def iter_chunks(parts: tuple) -> Iterator[bytes]:
+    """Bytes of parts in order: str, bytes or binary files (read from the start)."""
+    for part in parts:
+        if isinstance(part, str):
+            yield part.encode()
+        elif isinstance(part, bytes):
+            yield part
+        else:
+            part.seek(0)
+            while chunk := part.read(COPY_CHUNK):
+                yield chunk
+
+
+def write_if_changed(filepath: str, *parts) -> str:
+    """Atomically write parts (str, bytes or binary files) unless the file already holds them.
+
+    Returns 'created', 'updated' or 'unchanged'. Unchanged files keep their
+    mtime, so QMD and Obsidian have nothing to re-index. Writes go to a
+    hidden temp file that is renamed over the target, so readers never see
+    a half-written file. Contents are compared and copied in chunks, so a
+    spooled body is never loaded whole.
+    """
+    size = sum(len(c) for c in iter_chunks(parts))
+    try:
+        if os.path.getsize(filepath) == size:
+            new = hashlib.sha256()
+            for chunk in iter_chunks(parts):
+                new.update(chunk)
+            old = hashlib.sha256()
+            with open(filepath, 'rb') as f:
+                while chunk := f.read(COPY_CHUNK):
+                    old.update(chunk)
+            if old.digest() == new.digest():
+                return 'unchanged'
+        status = 'updated'
+    except FileNotFoundError:
+        status = 'created'
+
+    dirname, name = os.path.split(filepath)
+    tmp = os.path.join(dirname, f'.{name}.tmp')
+    with open(tmp, 'wb') as f:
+        for chunk in iter_chunks(parts):
+            f.write(chunk)
+    os.replace(tmp, filepath)
+    return status
+
+
+def message_hash(msg: dict) -> str:
+    """Identity of a user message across sessions: timestamp + text.
+
+    A replayed message keeps its original timestamp, so the same words typed
+    again later hash differently.
+    """
+    return hashlib.sha1(f"{msg['timestamp']}\0{msg['content']}".encode('utf-8', 'surrogatepass')).hexdigest()[:16]
+
+
+def replayed_prefix(hashes: list[str], owners: dict[str, str], key: str) -> tuple[int, list[str]]:
+    """Length of the leading run of messages other sessions hold, and those sessions.
+
+    owners maps message hashes to the manifest key (source JSONL path) of
+    the session that holds them; the session at key never counts as
+    replaying itself, wherever its markdown was written. Returns the run
+    length and the owning keys in order of appearance.
+    """
+    continues = []
+    n = 0
+    for h in hashes:
+        owner = owners.get(h)
+        if owner is None or owner == key:
+            break
+        if owner not in continues:
+            continues.append(owner)
+        n += 1
+    return n, continues
+
+
+class PartSplitter:
+    """Decides where a session's markdown is cut into linked part files.
+
+    Parts break at message boundaries only: before a message that would push
+    the part's sections past max_chars (a bigger message gets a part of its
+    own), or, with by_hour, before a message from a different UTC hour than
+    the part's first one. The state is plain data kept in the manifest, so
+    appends continue splitting exactly where a full run would.
+    """
+
+    def __init__(self, max_chars: int = 0, by_hour: bool = False, state: dict | None = None):
+        self.max_chars = max_chars
+        self.by_hour = by_hour
+        state = state or {}
+        self.part = state.get('part', 1)
+        self.count = state.get('count', 0)
+        self.chars = state.get('chars', 0)
+        self.hour = state.get('hour', '')
+
+    def place(self, section: str, timestamp: str) -> bool:
+        """Account for one message section; True if it starts a new part."""
+        hour = timestamp[:13]
+        over_size = self.max_chars and self.chars + len(section) > self.max_chars
+        new_hour = self.by_hour and hour and self.hour and hour != self.hour
+        new_part = self.count > 0 and bool(over_size or new_hour)
+        if new_part:
+            self.part += 1
+            self.count = self.chars = 0
+            self.hour = ''
+        self.hour = self.hour or hour
+        self.count += 1
+        self.chars += len(section)
+        return new_part
+
+    def state(self) -> dict:
+        return {'part': self.part, 'count': self.count, 'chars': self.chars, 'hour': self.hour}
+
+
+def part_path(filepath: str, part: int) -> str:
+    """Path of a session's n-th part file; part 1 is the session file itself."""
+    return filepath if part == 1 else f"{filepath[:-3]}-p{part}.md"
+
+
+def section_text(msg: dict) -> str:
+    return '\n'.join(message_lines([msg]))
+
+
+def write_part(filepath: str, part: int, session_id: str, title: str, body, count: int,
+               replayed: int = 0, continues: list[str] = ()) -> str:
+    """Write one part file: header, then the message sections spooled in body.
+
+    Part 1 is a plain session file (with the dedup link if it replays
+    earlier sessions); later parts link back to part 1 and their
+    predecessor. Earlier parts are never touched when a part is added.
+    Returns the write_if_changed status.
+    """
+    base = Path(filepath).stem
+    lines = []
+    lines.append('---')
+    lines.append(f'date: {base[:10]}')
+    lines.append(f'session_id: {session_id}')
+    lines.append(f'title: "{title}"')
+    lines.append(f'type: session-log')
+    lines.append(f'messages: {count}')
+    links = [Path(p).stem for p in continues]
+    if replayed:
+        lines.append(f'replayed: {replayed}')
+        lines.append(f'continues: [{", ".join(links)}]')
+    prev = Path(part_path(filepath, part - 1)).stem
+    if part > 1:
+        lines.append(f'part: {part}')
+        lines.append(f'prev: {prev}')
+    lines.append('---')
+    lines.append('')
+    lines.append(f'# {title}' if part == 1 else f'# {title} (part {part})')
+    lines.append('')
+    if replayed:
+        lines.append(f'> Continues {", ".join(f"[[{link}]]" for link in links)} '
+                     f'({replayed} earlier messages not repeated here)')
+        lines.append('')
+    if part > 1:
+        lines.append(f'> Part {part} of [[{base}]]' + (f', after [[{prev}]]' if part > 2 else ''))
+        lines.append('')
+    return write_if_changed(part_path(filepath, part), '\n'.join(lines), body)
+
+
+def remove_stale_parts(filepath: str, parts: int):
+    """Delete part files past the last one, left by an earlier split."""
+    for path in glob.glob(glob.escape(filepath[:-3]) + '-p*.md'):
+        m = re.search(r'-p(\d+)\.md$', path)
+        if m and int(m.group(1)) > parts:
+            os.remove(path)
+
+
+def remove_session_files(filepath: str):
+    """Delete a session's markdown file and all its part files."""
+    if os.path.exists(filepath):
+        os.remove(filepath)
+    remove_stale_parts(filepath, 0)
+
 
-    with open(filepath, 'w') as f:
-        f.write('\n'.join(lines))
+def write_session_md(session: dict, output_dir: str, replayed: int = 0,
+                     continues: list[str] = (), splitter: PartSplitter | None = None) -> tuple[str, list[str]]:
+    """Write a session's user messages as structured markdown.
 
-    return filepath
+    The first replayed messages are already held by the earlier continues
+    files and are linked instead of written. Sections are streamed into a
+    spooled body (in memory up to SPOOL_MEMORY, then on disk) and the header
+    goes in front once the count is known, so the session is never held
+    whole in memory. A splitter cuts the session into part files; it is
+    left holding the split state of the last part.
+
+    Returns (filepath, statuses): the part 1 path and the write_if_changed
+    status of each part.
+    """
+    filepath = session_md_path(session, output_dir)
+    title = derive_title(session_messages(session, replayed))
+    splitter = splitter or PartSplitter()
+    statuses = []
+
+    body = tempfile.SpooledTemporaryFile(max_size=SPOOL_MEMORY)
+    count = 0
+    try:
+        for msg in session_messages(session, replayed):
+            section = section_text(msg)
+            if splitter.place(section, msg['timestamp']):
+                part = splitter.part - 1
+                statuses.append(write_part(filepath, part, session['session_id'], title, body, count,
+                                           *((replayed, continues) if part == 1 else ())))
+                body.close()
+                body = tempfile.SpooledTemporaryFile(max_size=SPOOL_MEMORY)
+                count = 0
+            body.write(('\n' + section).encode())
+            count += 1
+        part = splitter.part
+        statuses.append(write_part(filepath, part, session['session_id'], title, body, count,
+                                   *((replayed, continues) if part == 1 else ())))
+    finally:
+        body.close()
+
+    remove_stale_parts(filepath, splitter.part)
+    return filepath, statuses
+
+
+def read_frontmatter(filepath: str) -> dict:
+    """Top-level key: value pairs of a markdown file's frontmatter."""
+    fields = {}
+    with open(filepath) as f:
+        if f.readline().rstrip('\n') != '---':
+            return fields
+        for line in f:
+            line = line.rstrip('\n')
+            if line == '---':
+                break
+            key, sep, value = line.partition(': ')
+            if sep:
+                fields[key] = value[1:-1] if value.startswith('"') and value.endswith('"') else value
+    return fields
+
+
+def append_session_md(filepath: str, messages: list[dict]) -> str:
+    """Append new messages to an existing session or part file and bump its count.
+
+    Produces the same file write_session_md would for the full message list.
+    An untitled session picks up its title from the new messages. Returns the
+    session's title after the append.
+    """
+    with open(filepath) as f:
+        text = f.read()
+
+    m = re.search(r'^messages: (\d+)$', text, flags=re.MULTILINE)
+    if m:
+        text = text[:m.start(1)] + str(int(m.group(1)) + len(messages)) + text[m.end(1):]
+    if f'\ntitle: "{UNTITLED}"\n' in text:
+        title = derive_title(messages)
+        text = text.replace(f'\ntitle: "{UNTITLED}"\n', f'\ntitle: "{title}"\n', 1)
+        # Part files keep their "(part N)" suffix
+        text = re.sub(rf'^# {UNTITLED}( \(part \d+\))?$', lambda m: f'# {title}{m.group(1) or ""}',
+                      text, count=1, flags=re.MULTILINE)
+    text += '\n'.join([''] + message_lines(messages))
+
+    write_if_changed(filepath, text)
+    m = re.search(r'^title: "(.*)"$', text, flags=re.MULTILINE)
+    return m.group(1) if m else derive_title(messages)
+
+
+def body_chars(filepath: str, count: int) -> int:
+    """Characters of a written session's message sections, as PartSplitter counts them.
+
+    For manifests that predate split state: the sections start at the first
+    '## ' line after the header, and each was written after a newline the
+    splitter doesn't count.
+    """
+    with open(filepath) as f:
+        text = f.read()
+    start = text.find('\n## ', text.find('\n---', 3) + 1)
+    if start < 0:
+        return 0
+    return max(0, len(text) - start - 1 - max(count - 1, 0))
+
+
+def append_parts(outfile: str, messages: list[dict], splitter: PartSplitter) -> tuple[str, list[str]]:
+    """Add new messages to a written session, continuing its part split.
+
+    Messages that still fit go onto the current last part; the rest start
+    new part files. Returns (title, statuses) like write_session_md.
+    """
+    groups = {}
+    last_part = splitter.part
+    for msg in messages:
+        splitter.place(section_text(msg), msg['timestamp'])
+        groups.setdefault(splitter.part, []).append(msg)
+
+    fields = read_frontmatter(outfile)
+    title = fields.get('title')
+    # An untitled session names new parts after their own messages
+    if not title or title == UNTITLED:
+        title = derive_title(messages)
+    statuses = []
+    for part, msgs in sorted(groups.items()):
+        if part == last_part:
+            title = append_session_md(part_path(outfile, part), msgs)
+            statuses.append('updated')
+            continue
+        with tempfile.SpooledTemporaryFile(max_size=SPOOL_MEMORY) as body:
+            for msg in msgs:
+                body.write(('\n' + section_text(msg)).encode())
+            statuses.append(write_part(outfile, part, fields.get('session_id', ''), title, body, len(msgs)))
+    return title, statuses
+
+
+def load_manifest(path: str) -> dict:
+    """Load the processed-file manifest, or an empty one."""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def save_manifest(path: str, manifest: dict):
+    tmp = path + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def manifest_entry(st: os.stat_result, offset: int, **fields) -> dict:
+    return {'inode': st.st_ino, 'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'offset': offset, **fields}
+
+
+def parse_task(task: tuple[str, int, datetime, str | None]) -> dict:
+    """Worker: parse one session file, from a byte offset for resumed sessions.
+
+    With spool_dir, a new session's messages are streamed to a hidden spool
+    file there (see extract_session) instead of being sent back in memory.
+    Returns the parse result plus timing, so the caller can report per-worker
+    throughput.
+    """
+    filepath, start, cutoff, spool_dir = task
+    t0 = time.perf_counter()
+    if start:
+        messages, _, offset = read_user_messages(filepath, start)
+        result = {'messages': messages, 'offset': offset}
+        end = offset
+    else:
+        spool = None
+        if spool_dir:
+            fd, spool = tempfile.mkstemp(prefix='.spool-', suffix='.jsonl', dir=spool_dir)
+            os.close(fd)
+        session = extract_session(filepath, cutoff, spool)
+        result = {'session': session}
+        end = session['offset'] if session else os.path.getsize(filepath)
+    result.update({
+        'pid': os.getpid(),
+        'seconds': time.perf_counter() - t0,
+        'bytes': end - start,
+    })
+    return result
+
+
+def run_tasks(tasks: list[tuple[str, int, datetime, str | None]], jobs: int, nbytes: int) -> list[dict]:
+    """Parse sessions serially or across a process pool, keeping task order.
+
+    nbytes is the total left to read; small runs stay in this process (see
+    recall_day.pool_workers).
+    """
+    workers = recall_day.pool_workers([Path(task[0]) for task in tasks], jobs, nbytes)
+    if workers:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(parse_task, tasks, chunksize=max(1, len(tasks) // (workers * 4))))
+    return [parse_task(task) for task in tasks]
+
+
+def print_worker_stats(results: list[dict]):
+    """Per-worker throughput: sessions, MB parsed, busy time, MB/s."""
+    workers = {}
+    for r in results:
+        w = workers.setdefault(r['pid'], {'files': 0, 'bytes': 0, 'seconds': 0.0})
+        w['files'] += 1
+        w['bytes'] += r['bytes']
+        w['seconds'] += r['seconds']
+    for pid, w in sorted(workers.items()):
+        mb = w['bytes'] / (1024 * 1024)
+        rate = mb / w['seconds'] if w['seconds'] else 0
+        print(f"  worker {pid}: {w['files']} sessions, {mb:.1f}MB in {w['seconds']:.2f}s ({rate:.1f}MB/s)")
 
 
 def main():
@@ -211,7 +738,22 @@ def main():
     parser.add_argument('--days', type=int, default=DEFAULT_DAYS, help=f'How many days back to extract (default: {DEFAULT_DAYS})')
     parser.add_argument('--source', default=DEFAULT_SOURCE, help='Source directory with JSONL files')
     parser.add_argument('--output', default=DEFAULT_OUTPUT, help='Output directory for markdown files')
+    parser.add_argument('--full', action='store_true', help='Ignore the manifest and re-extract every session')
+    parser.add_argument('--jobs', type=int, default=DEFAULT_JOBS, help=f'Parallel parse workers (default: {DEFAULT_JOBS})')
+    parser.add_argument('--max-chars-per-file', type=int, default=0, metavar='N',
+                        help='Split sessions into linked part files of at most N characters of messages')
+    parser.add_argument('--split-by', choices=['none', 'hour'], default='none',
+                        help='Also start a new part file for each UTC hour of a session (default: none)')
+    parser.add_argument('--stream-above', type=float, default=DEFAULT_STREAM_ABOVE, metavar='MB',
+                        help=f'Stream sessions of at least MB through a disk spool (default: {DEFAULT_STREAM_ABOVE})')
+    parser.add_argument('--no-dedup', action='store_true',
+                        help='Write replayed messages of resumed sessions in full instead of linking')
+    parser.add_argument('--index', default=str(recall_day.SEARCH_INDEX_PATH),
+                        help=f'Full-text search index (default: {recall_day.SEARCH_INDEX_PATH})')
+    parser.add_argument('--no-index', action='store_true', help="Don't maintain the search index")
     args = parser.parse_args()
+    # Paths stored in the manifest and the index must not depend on the cwd
+    args.output = os.path.realpath(args.output)
 
     cutoff = datetime.now(timezone.utc) - timedelta(days=args.days)
     pattern = os.path.join(args.source, "*.jsonl")
@@ -227,34 +769,193 @@ def main():
     print(f"Found {len(recent_files)} session files from last {args.days} days (of {len(all_files)} total)")
 
     os.makedirs(args.output, exist_ok=True)
+    # Spools left behind by an interrupted run
+    for spool in glob.glob(os.path.join(args.output, '.spool-*.jsonl')):
+        os.remove(spool)
+    manifest_path = os.path.join(args.output, MANIFEST_NAME)
+    manifest = {} if args.full else load_manifest(manifest_path)
+    for state in manifest.values():
+        # Older manifests stored the output path as given on the command line
+        if state.get('outfile') and not os.path.isabs(state['outfile']):
+            state['outfile'] = os.path.join(args.output, os.path.basename(state['outfile']))
+
+    index = None
+    if not args.no_index:
+        try:
+            index = recall_day.MessageIndex(Path(args.index))
+        except (OSError, sqlite3.Error) as e:
+            print(f"Warning: search index unavailable ({e}), skipping it")
+        else:
+            if manifest and index.is_empty():
+                print(f"Search index {args.index} is empty, re-extracting all sessions to fill it")
+                manifest = {}
 
+    written = {'created': 0, 'updated': 0, 'unchanged': 0}
     extracted = 0
+    appended = 0
+    unchanged = 0
     skipped = 0
     total_messages = 0
-
+    deduped = 0
+    replayed_total = 0
+    replay_only = 0
+
+    # Message hash -> manifest key of the session holding it, for dedup.
+    # Sessions that left the window drop their hashes, so the manifest stays
+    # bounded; a resumed session whose origin is that old is written in full
+    owners = {}
+    in_window = {os.path.abspath(f) for f in recent_files}
+    for key, state in manifest.items():
+        if key not in in_window:
+            state.pop('hashes', None)
+        elif state.get('outfile'):
+            for h in state.get('hashes', ()):
+                owners.setdefault(h, key)
+
+    # Plan: decide per file whether to skip, resume from an offset, or extract
+    split_settings = {'max_chars': args.max_chars_per_file, 'split_by': args.split_by}
+    tasks = []
     for filepath in sorted(recent_files):
-        session = extract_session(filepath)
+        key = os.path.abspath(filepath)
+        st = os.stat(filepath)
+        state = manifest.get(key)
+        same_file = state is not None and state['inode'] == st.st_ino and state['size'] <= st.st_size
+        outfile = state.get('outfile') if state else None
+        # Written with other split settings: re-extract to lay out the parts again
+        if outfile and state.get('split_settings', NO_SPLIT) != split_settings:
+            same_file = False
+
+        if same_file and state['size'] == st.st_size and state['mtime_ns'] == st.st_mtime_ns \
+                and (outfile is None or os.path.exists(outfile)):
+            unchanged += 1
+            if outfile:
+                written['unchanged'] += (state.get('split') or {}).get('part', 1)
+            continue
+
+        # Grown session already written: read only the appended bytes
+        start = state['offset'] if same_file and outfile and os.path.exists(outfile) else 0
+        tasks.append((filepath, start, st, state))
+
+    t0 = time.perf_counter()
+    stream_bytes = args.stream_above * 1024 * 1024
+    results = run_tasks([(filepath, start, cutoff, args.output if not start and st.st_size >= stream_bytes else None)
+                         for filepath, start, st, _ in tasks], args.jobs,
+                        sum(st.st_size - start for _, start, st, _ in tasks))
+    elapsed = time.perf_counter() - t0
+
+    # Apply results deterministically, whatever the worker scheduling: appends
+    # to known sessions first, then new sessions by first and last message
+    # time. A resumed session replays its origin's messages with their
+    # original timestamps, so it starts with or after the origin and ends later
+    def apply_order(item):
+        (filepath, start, _, _), result = item
+        session = result.get('session')
+        if start or not session:
+            return (0 if start else 1, '', '', filepath)
+        return (1, session['first_ts'] or '', session['last_ts'] or '', filepath)
+
+    for (filepath, start, st, state), result in sorted(zip(tasks, results), key=apply_order):
+        key = os.path.abspath(filepath)
+
+        if start:
+            messages, offset = result['messages'], result['offset']
+            hashes = state.get('hashes', [])
+            # Manifests without split state predate part files: one part
+            split = state.get('split') or {'part': 1, 'count': state['messages'],
+                                           'chars': body_chars(state['outfile'], state['messages']),
+                                           'hour': ''}
+            if messages:
+                total = state['messages'] + len(messages)
+                splitter = PartSplitter(args.max_chars_per_file, args.split_by == 'hour', split)
+                title, statuses = append_parts(state['outfile'], messages, splitter)
+                split = splitter.state()
+                for status in statuses:
+                    written[status] += 1
+                if index is not None:
+                    outfile = state['outfile']
+                    session_id = index.session_id(outfile) or Path(filepath).stem
+                    index.add_messages(outfile, session_id, title, messages)
+                    index.set_title(outfile, title)
+                appended += 1
+                total_messages += len(messages)
+                state = {**state, 'messages': total}
+                new_hashes = [message_hash(m) for m in messages]
+                for h in new_hashes:
+                    owners.setdefault(h, key)
+                hashes = hashes + new_hashes
+            else:
+                unchanged += 1
+                written['unchanged'] += split['part']
+            manifest[key] = manifest_entry(st, offset, outfile=state['outfile'], messages=state['messages'],
+                                           hashes=hashes, split=split, split_settings=split_settings)
+            continue
+
+        session = result['session']
         if session is None:
             skipped += 1
+            manifest[key] = manifest_entry(st, st.st_size, outfile=None, messages=0)
             continue
 
-        # Check if first timestamp is within our window
-        if session['first_ts']:
-            try:
-                dt = datetime.fromisoformat(session['first_ts'].replace('Z', '+00:00'))
-                if dt < cutoff:
-                    skipped += 1
-                    continue
-            except:
-                pass
-
-        outpath = write_session_md(session, args.output)
-        extracted += 1
-        total_messages += len(session['messages'])
+        # Started before the window (only its head was read)
+        if session['stale']:
+            skipped += 1
+            # Not recorded: a larger --days may include it later
+            continue
 
-    print(f"Extracted: {extracted} sessions, {total_messages} messages")
-    print(f"Skipped: {skipped} sessions (no user messages or sub-agents)")
+        # Skip the leading messages an earlier session already holds
+        outpath = session_md_path(session, args.output)
+        replayed, continues = (0, []) if args.no_dedup else replayed_prefix(session['hashes'], owners, key)
+        continues = [manifest[k]['outfile'] for k in continues if manifest[k].get('outfile')]
+        if replayed:
+            deduped += 1
+            replayed_total += replayed
+        if replayed and replayed == session['count']:
+            # Nothing of its own yet: no file, re-read in full once it grows
+            replay_only += 1
+            # Drop a full copy written by an earlier run (--no-dedup, or before
+            # its origin was extracted)
+            remove_session_files(outpath)
+            if index is not None:
+                index.replace_session(outpath, session['session_id'], '', ())
+            if session['spool']:
+                os.remove(session['spool'])
+            manifest[key] = manifest_entry(st, session['offset'], outfile=None, messages=0)
+            continue
+        hashes = session['hashes'][replayed:]
+        for h in hashes:
+            owners.setdefault(h, key)
+
+        splitter = PartSplitter(args.max_chars_per_file, args.split_by == 'hour')
+        outpath, statuses = write_session_md(session, args.output, replayed, continues, splitter)
+        extracted += 1
+        for status in statuses:
+            written[status] += 1
+        if index is not None:
+            index.replace_session(outpath, session['session_id'], derive_title(session_messages(session, replayed)),
+                                  session_messages(session, replayed))
+        if session['spool']:
+            os.remove(session['spool'])
+        total_messages += len(hashes)
+        manifest[key] = manifest_entry(st, session['offset'], outfile=outpath,
+                                       messages=len(hashes), hashes=hashes, split=splitter.state(),
+                                       split_settings=split_settings)
+
+    save_manifest(manifest_path, manifest)
+    if index is not None:
+        index.close()
+
+    print(f"Extracted: {extracted} sessions, appended to {appended}, {unchanged} unchanged ({total_messages} new messages)")
+    print(f"Files: {written['created']} created, {written['updated']} updated, "
+          f"{written['unchanged']} unchanged")
+    if deduped:
+        print(f"Deduplicated: {replayed_total} replayed messages in {deduped} resumed sessions"
+              + (f" ({replay_only} fully replayed, not written)" if replay_only else ""))
+    print(f"Skipped: {skipped} sessions (no user messages, sub-agents, or started before the window)")
     print(f"Output: {args.output}")
+    if results and args.jobs > 1:
+        mb = sum(r['bytes'] for r in results) / (1024 * 1024)
+        print(f"Parsed {len(results)} sessions ({mb:.1f}MB) in {elapsed:.2f}s:")
+        print_worker_stats(results)
 
 
 if __name__ == '__main__':
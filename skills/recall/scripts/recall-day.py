@@ -2,25 +2,73 @@
 """Recall sessions by date from native Claude Code JSONL files.
 
 Usage:
-    recall-day.py list DATE_EXPR [--project PATH] [--all-projects] [--min-msgs N]
-    recall-day.py expand SESSION_ID [--project PATH] [--all-projects] [--max-msgs N]
+    recall-day.py list DATE_EXPR [--project PATH] [--all-projects] [--min-msgs N] [--grep PATTERN]
+                                 [--format table|ndjson|json] [--sort] [--no-cache] [--jobs N]
+    recall-day.py expand SESSION_ID [--project PATH] [--all-projects] [--max-msgs N] [--from-msg N]
+    recall-day.py search QUERY [QUERY ...] [-c sessions,notes,daily] [-n N] [--per-query N]
+                         [--format table|ndjson|json] [--index PATH]
 
 DATE_EXPR examples: yesterday, today, 2026-02-25, "last tuesday", "this week",
                     "last week", "3 days ago", "last 3 days"
 
 Every Claude Code user has JSONL session files in ~/.claude/projects/.
 No custom setup needed.
+
+Session metadata is cached in a SQLite index (cache/sessions.db in the skill
+directory, override with RECALL_CACHE_DIR). Rows are keyed by path + size +
+mtime, so unchanged sessions are never re-parsed. expand --from-msg uses a
+per-session index of user-message byte offsets to seek straight to a page.
+
+search queries an FTS5 index of user messages (cache/messages.db) that
+extract-sessions.py maintains alongside its markdown output, so topic recall
+works in-process without qmd. Several query variants and collections run
+concurrently in one call (non-session collections via qmd) and are merged
+with reciprocal-rank fusion.
 """
 
 import argparse
+import functools
 import json
 import os
 import re
+import shutil
+import sqlite3
+import subprocess
 import sys
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Any, TypedDict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
 
 CLAUDE_PROJECTS = Path.home() / ".claude" / "projects"
+DEFAULT_JOBS = os.cpu_count() or 1
+# Starting worker processes costs more than reading a few small sessions:
+# below both thresholds, --jobs work runs in this process
+POOL_MIN_FILES = 16
+POOL_MIN_BYTES = 16 * 1024 * 1024
+CACHE_DIR = Path(os.environ.get("RECALL_CACHE_DIR") or Path(__file__).parent.parent / "cache")
+INDEX_PATH = CACHE_DIR / "sessions.db"
+# Bump when the index schema or the stored metadata changes
+INDEX_VERSION = 6
+# Full-text index of extracted user messages, maintained by extract-sessions.py
+SEARCH_INDEX_PATH = CACHE_DIR / "messages.db"
+# Bump when the message schema or the stored paths change
+SEARCH_INDEX_VERSION = 2
+# Collection served by the local index; others are delegated to qmd
+LOCAL_COLLECTION = 'sessions'
+# Reciprocal-rank fusion constant (the usual k=60 from Cormack et al.)
+RRF_K = 60
 
 # Reuse from extract-sessions.py
 STRIP_PATTERNS = [
@@ -32,6 +80,114 @@ STRIP_PATTERNS = [
     re.compile(r'<teammate-message[^>]*>.*?</teammate-message>', re.DOTALL),
 ]
 
+# Raw-byte markers for the line prefilter. A line without the marker can't
+# carry that field at the top level, so it is skipped without decoding.
+USER_TYPE_RE = re.compile(rb'"type"\s*:\s*"user"')
+TIMESTAMP_MARKER = b'"timestamp"'
+TIMESTAMP_RE = re.compile(rb'"timestamp"\s*:\s*"([^"\\]+)"')
+SESSION_ID_RE = re.compile(rb'"sessionId"\s*:\s*"([^"\\]+)"')
+USER_MESSAGE_RE = re.compile(rb'"message"\s*:\s*\{\s*"role"\s*:\s*"user"')
+
+
+def record_head(line: bytes) -> int:
+    """End of a raw record's leading top-level keys.
+
+    Claude Code writes a record's scalar keys (type, sessionId, ...) ahead
+    of its message and other nested payloads, so a marker before this offset
+    is the record's own rather than part of a tool input or result. That is
+    the writer's key order, not a JSON guarantee: callers only skip
+    decoding when the head settles the question.
+    """
+    end = line.find(b'"message"')
+    if end < 0:
+        end = line.find(b'{', 1)
+    return end if end >= 0 else len(line)
+
+
+def user_message_timestamp(line: bytes) -> str | None:
+    """Timestamp of a user-message line read from its bytes, or None to decode.
+
+    Only trusts an unambiguous line: a complete record with one
+    "type":"user" in its head, a message opening with "role":"user" and at
+    most one timestamp key ('' when there is none). Anything else (nested
+    records, another key order, a truncated line) returns None.
+    """
+    if not line.rstrip().endswith(b'}'):
+        return None
+    head = record_head(line)
+    m = USER_TYPE_RE.search(line, 0, head)
+    if m is None or USER_TYPE_RE.search(line, m.end(), head) or not USER_MESSAGE_RE.match(line, head):
+        return None
+    stamps = TIMESTAMP_RE.findall(line)
+    if len(stamps) > 1:
+        return None
+    return stamps[0].decode() if stamps else ''
+
+
+def _select_json_backend() -> str:
+    """Pick the JSONL decoder: RECALL_JSON if set, else orjson, msgspec, json."""
+    available = {'json': True, 'orjson': orjson is not None, 'msgspec': msgspec is not None}
+    forced = os.environ.get('RECALL_JSON')
+    if forced:
+        if not available.get(forced):
+            print(f"Warning: RECALL_JSON={forced} not available, using auto-detect", file=sys.stderr)
+        else:
+            return forced
+    return next(name for name in ('orjson', 'msgspec', 'json') if available[name])
+
+
+JSON_BACKEND = _select_json_backend()
+
+# Every backend's decode error is a ValueError except msgspec's
+DECODE_ERRORS = (ValueError, msgspec.DecodeError) if msgspec is not None else (ValueError,)
+
+
+def _with_fallback(decode):
+    """Retry lines the fast decoder rejects with json.loads.
+
+    orjson and msgspec are stricter than the stdlib (a lone surrogate
+    escape like "\\ud83d" is an error), so a line is only skipped when
+    json.loads rejects it too. Fallback results that aren't objects raise
+    ValueError, as the msgspec record decoder does.
+    """
+    def decode_or_fallback(line):
+        try:
+            return decode(line)
+        except DECODE_ERRORS:
+            obj = json.loads(line)
+            if not isinstance(obj, dict):
+                raise ValueError("JSONL record is not an object")
+            return obj
+    return decode_or_fallback
+
+
+if JSON_BACKEND == 'orjson':
+    loads = _with_fallback(orjson.loads)
+elif JSON_BACKEND == 'msgspec':
+    loads = _with_fallback(msgspec.json.decode)
+else:
+    loads = json.loads
+
+
+def record_decoder(*fields: str):
+    """Decoder for JSONL records that only needs the given top-level fields.
+
+    With msgspec installed (and not overridden by RECALL_JSON), decodes into
+    a TypedDict of just those fields: other keys (toolUseResult, multi-MB
+    snapshots) are skipped, not materialized. The result is a plain dict,
+    so callers use .get() either way. Otherwise returns the full `loads`.
+    Non-object lines raise one of DECODE_ERRORS, like malformed JSON, and
+    lines msgspec rejects but json.loads accepts are decoded by json.loads.
+    """
+    if msgspec is None or os.environ.get('RECALL_JSON', 'msgspec') != 'msgspec':
+        return loads
+    record = TypedDict('Record', {f: Any for f in fields}, total=False)
+    return _with_fallback(msgspec.json.Decoder(record).decode)
+
+
+# All readers in this script only look at these fields
+decode_record = record_decoder('type', 'timestamp', 'message')
+
 DAY_NAMES = {
     'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
     'friday': 4, 'saturday': 5, 'sunday': 6,
@@ -44,7 +200,11 @@ def clean_content(text: str) -> str:
         return ""
     for pat in STRIP_PATTERNS:
         text = pat.sub('', text)
-    return text.strip()
+    text = text.strip()
+    # json.loads keeps lone surrogate escapes, which can't be written as UTF-8
+    if not text.isascii():
+        text = text.encode('utf-8', 'replace').decode('utf-8')
+    return text
 
 
 def extract_text(content) -> str:
@@ -153,60 +313,423 @@ def get_project_dirs(project_path: str | None, all_projects: bool) -> list[Path]
     return [d for d in CLAUDE_PROJECTS.iterdir() if d.is_dir()]
 
 
-def scan_session_metadata(filepath: Path, date_start: datetime, date_end: datetime) -> dict | None:
-    """Fast scan: read first ~30 lines for metadata, count user messages."""
-    session_id = filepath.stem
-    start_time = None
-    first_user_msg = None
-    user_msg_count = 0
-    file_size = filepath.stat().st_size
+class SessionIndex:
+    """Persistent session metadata cache, keyed by path + size + mtime.
 
-    try:
-        with open(filepath) as f:
-            for i, line in enumerate(f):
-                try:
-                    obj = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
+    Finished sessions never change, so a hit skips the JSONL entirely. A
+    changed size or mtime invalidates the row and the file is re-scanned.
 
-                # Get session ID from data if available
-                if obj.get('sessionId'):
-                    session_id = obj['sessionId']
+    Alongside it, a file table maps lowercased session file stems to paths
+    for O(log n) prefix lookups. A project directory is re-listed only when
+    its own mtime changes (files added, removed or renamed).
 
-                ts_str = obj.get('timestamp')
-                if ts_str and not start_time:
-                    try:
-                        start_time = datetime.fromisoformat(ts_str.replace('Z', '+00:00'))
-                    except (ValueError, TypeError):
-                        pass
+    The activity table is a per-UTC-day timeline of each session (first and
+    last user-message timestamp, message count), so a date range only loads
+    sessions that were active in it, including resumed ones.
 
-                # Count user messages and capture first
-                if obj.get('type') == 'user' and obj.get('message', {}).get('role') == 'user':
-                    user_msg_count += 1
-                    if first_user_msg is None:
-                        raw = extract_text(obj['message'].get('content', ''))
-                        cleaned = clean_content(raw)
-                        if cleaned and len(cleaned) >= 5:
-                            # Skip pure slash commands
-                            if not re.match(r'^/\w+\s*$', cleaned):
-                                first_user_msg = cleaned
-
-                # Early exit: if we have start_time and it's outside range, skip
-                if start_time and i < 5:
-                    if start_time >= date_end or start_time < date_start - timedelta(days=1):
-                        return None
+    Message offsets map the n-th user message expand would show to its byte
+    offset. Sessions are append-only, so a grown file is resumed from the
+    last scanned position; a shrunk file is re-scanned from the start.
+    """
 
-    except (OSError, UnicodeDecodeError):
-        return None
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS sessions (
+            path TEXT PRIMARY KEY,
+            size INTEGER NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            session_id TEXT NOT NULL,
+            start_time TEXT,
+            end_time TEXT,
+            user_msg_count INTEGER NOT NULL,
+            title TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS activity (
+            path TEXT NOT NULL,
+            day TEXT NOT NULL,
+            first_ts TEXT NOT NULL,
+            last_ts TEXT NOT NULL,
+            user_msgs INTEGER NOT NULL,
+            PRIMARY KEY (path, day)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS activity_day ON activity (day);
+        CREATE TABLE IF NOT EXISTS files (
+            path TEXT PRIMARY KEY,
+            project TEXT NOT NULL,
+            stem TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS files_stem ON files (stem);
+        CREATE INDEX IF NOT EXISTS files_project ON files (project);
+        CREATE TABLE IF NOT EXISTS projects (
+            path TEXT PRIMARY KEY,
+            mtime_ns INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS offset_scans (
+            path TEXT PRIMARY KEY,
+            scanned_to INTEGER NOT NULL,
+            msg_total INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS msg_offsets (
+            path TEXT NOT NULL,
+            n INTEGER NOT NULL,
+            offset INTEGER NOT NULL,
+            PRIMARY KEY (path, n)
+        ) WITHOUT ROWID;
+    """
 
-    if not start_time:
+    def __init__(self, path: Path = INDEX_PATH):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(path)
+        if self.db.execute('PRAGMA user_version').fetchone()[0] != INDEX_VERSION:
+            tables = self.db.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()
+            for (name,) in tables:
+                self.db.execute(f'DROP TABLE IF EXISTS "{name}"')
+            self.db.execute(f'PRAGMA user_version = {INDEX_VERSION}')
+        self.db.executescript(self.SCHEMA)
+
+    def get(self, filepath: Path, st: os.stat_result) -> dict | None:
+        """Return cached metadata if the file is unchanged since it was indexed."""
+        row = self.db.execute(
+            'SELECT session_id, start_time, end_time, user_msg_count, title FROM sessions '
+            'WHERE path = ? AND size = ? AND mtime_ns = ?',
+            (str(filepath), st.st_size, st.st_mtime_ns),
+        ).fetchone()
+        if row is None:
+            return None
+        session_id, start_time, end_time, user_msg_count, title = row
+        activity = {
+            day: [datetime.fromisoformat(first), datetime.fromisoformat(last), msgs]
+            for day, first, last, msgs in self.db.execute(
+                'SELECT day, first_ts, last_ts, user_msgs FROM activity WHERE path = ?', (str(filepath),))
+        }
+        return {
+            'session_id': session_id,
+            'start_time': datetime.fromisoformat(start_time) if start_time else None,
+            'end_time': datetime.fromisoformat(end_time) if end_time else None,
+            'user_msg_count': user_msg_count,
+            'file_size': st.st_size,
+            'title': title,
+            'filepath': str(filepath),
+            'activity': activity,
+        }
+
+    def is_fresh(self, filepath: Path, st: os.stat_result) -> bool:
+        """True if the file is indexed and unchanged since."""
+        return self.db.execute(
+            'SELECT 1 FROM sessions WHERE path = ? AND size = ? AND mtime_ns = ?',
+            (str(filepath), st.st_size, st.st_mtime_ns),
+        ).fetchone() is not None
+
+    def active_paths(self, date_start: datetime, date_end: datetime) -> set[str]:
+        """Paths of indexed sessions with activity in [date_start, date_end)."""
+        rows = self.db.execute(
+            'SELECT DISTINCT path FROM activity WHERE day >= ? AND day < ?',
+            (day_key(date_start), day_key(date_end)),
+        )
+        return {p for (p,) in rows}
+
+    def put(self, filepath: Path, st: os.stat_result, meta: dict):
+        path = str(filepath)
+        start_time = meta['start_time'].isoformat() if meta['start_time'] else None
+        end_time = meta['end_time'].isoformat() if meta['end_time'] else None
+        self.db.execute(
+            'INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            (path, st.st_size, st.st_mtime_ns, meta['session_id'],
+             start_time, end_time, meta['user_msg_count'], meta['title']),
+        )
+        self.db.execute('DELETE FROM activity WHERE path = ?', (path,))
+        self.db.executemany(
+            'INSERT INTO activity VALUES (?, ?, ?, ?, ?)',
+            [(path, day, first.isoformat(), last.isoformat(), msgs)
+             for day, (first, last, msgs) in meta['activity'].items()],
+        )
+
+    def project_files(self, proj_dir: Path) -> list[Path]:
+        """Session files in a project directory, re-listed only if it changed."""
+        project = str(proj_dir)
+        try:
+            mtime_ns = proj_dir.stat().st_mtime_ns
+        except OSError:
+            return []
+
+        row = self.db.execute('SELECT mtime_ns FROM projects WHERE path = ?', (project,)).fetchone()
+        if row is not None and row[0] == mtime_ns:
+            rows = self.db.execute('SELECT path FROM files WHERE project = ?', (project,))
+            return [Path(p) for (p,) in rows]
+
+        files = list(proj_dir.glob("*.jsonl"))
+        current = {str(fp) for fp in files}
+        old = {p for (p,) in self.db.execute('SELECT path FROM files WHERE project = ?', (project,))}
+        gone = [(p,) for p in old - current]
+        self.db.executemany('DELETE FROM files WHERE path = ?', gone)
+        self.db.executemany('DELETE FROM sessions WHERE path = ?', gone)
+        self.db.executemany('DELETE FROM activity WHERE path = ?', gone)
+        self.db.executemany('DELETE FROM offset_scans WHERE path = ?', gone)
+        self.db.executemany('DELETE FROM msg_offsets WHERE path = ?', gone)
+        self.db.executemany(
+            'INSERT OR IGNORE INTO files VALUES (?, ?, ?)',
+            [(str(fp), project, fp.stem.lower()) for fp in files],
+        )
+        self.db.execute('INSERT OR REPLACE INTO projects VALUES (?, ?)', (project, mtime_ns))
+        return files
+
+    def find_prefix(self, prefix: str, project_dirs: list[Path]) -> list[Path]:
+        """All session files in project_dirs whose stem starts with prefix."""
+        for proj_dir in project_dirs:
+            self.project_files(proj_dir)
+        projects = {str(d) for d in project_dirs}
+        rows = self.db.execute(
+            'SELECT path, project FROM files WHERE stem >= ? AND stem < ? ORDER BY stem, path',
+            (prefix, prefix + '\uffff'),
+        )
+        return [Path(p) for p, project in rows if project in projects]
+
+    def message_offset(self, filepath: Path, n: int) -> tuple[int | None, int]:
+        """Byte offset of the n-th shown user message (1-based), and the total."""
+        path = str(filepath)
+        size = filepath.stat().st_size
+        row = self.db.execute('SELECT scanned_to, msg_total FROM offset_scans WHERE path = ?', (path,)).fetchone()
+        scanned_to, total = row if row else (0, 0)
+
+        if scanned_to > size:
+            self.db.execute('DELETE FROM msg_offsets WHERE path = ?', (path,))
+            scanned_to, total = 0, 0
+
+        if scanned_to < size:
+            offsets, scanned_to = scan_message_offsets(filepath, scanned_to)
+            self.db.executemany(
+                'INSERT OR REPLACE INTO msg_offsets VALUES (?, ?, ?)',
+                [(path, total + i, off) for i, off in enumerate(offsets, 1)],
+            )
+            total += len(offsets)
+            self.db.execute('INSERT OR REPLACE INTO offset_scans VALUES (?, ?, ?)', (path, scanned_to, total))
+
+        row = self.db.execute('SELECT offset FROM msg_offsets WHERE path = ? AND n = ?', (path, n)).fetchone()
+        return (row[0] if row else None), total
+
+    def close(self):
+        self.db.commit()
+        self.db.close()
+
+
+def open_index(enabled: bool = True) -> SessionIndex | None:
+    """Open the metadata index, or None if disabled or unavailable."""
+    if not enabled:
         return None
-
-    # Final date check
-    if start_time < date_start or start_time >= date_end:
+    try:
+        return SessionIndex()
+    except (OSError, sqlite3.Error) as e:
+        print(f"Warning: session index unavailable ({e}), scanning without cache", file=sys.stderr)
         return None
 
-    # Derive title from first message
+
+def fts_query(text: str) -> str:
+    """Turn free text into an FTS5 query: any of its words, each quoted.
+
+    Quoting keeps FTS5 operators and punctuation in user input from being
+    parsed as query syntax. BM25 ranks messages matching more words higher.
+    """
+    words = re.findall(r'\w+', text)
+    return ' OR '.join(f'"{w}"' for w in words)
+
+
+class MessageIndex:
+    """SQLite FTS5 index of extracted user messages, ranked with BM25.
+
+    extract-sessions.py keeps it in step with the markdown it writes, one
+    row per message keyed by the markdown path. The FTS table is an
+    external-content index over the messages table, synced by triggers, so
+    a session's rows can be replaced through the path index.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS messages (
+            id INTEGER PRIMARY KEY,
+            path TEXT NOT NULL,
+            session_id TEXT NOT NULL,
+            timestamp TEXT NOT NULL,
+            title TEXT NOT NULL,
+            content TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS messages_path ON messages (path);
+        CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5 (
+            title, content, content='messages', content_rowid='id', tokenize='porter unicode61'
+        );
+        CREATE TRIGGER IF NOT EXISTS messages_ai AFTER INSERT ON messages BEGIN
+            INSERT INTO messages_fts (rowid, title, content) VALUES (new.id, new.title, new.content);
+        END;
+        CREATE TRIGGER IF NOT EXISTS messages_ad AFTER DELETE ON messages BEGIN
+            INSERT INTO messages_fts (messages_fts, rowid, title, content)
+            VALUES ('delete', old.id, old.title, old.content);
+        END;
+        CREATE TRIGGER IF NOT EXISTS messages_au AFTER UPDATE ON messages BEGIN
+            INSERT INTO messages_fts (messages_fts, rowid, title, content)
+            VALUES ('delete', old.id, old.title, old.content);
+            INSERT INTO messages_fts (rowid, title, content) VALUES (new.id, new.title, new.content);
+        END;
+    """
+
+    # BM25 column weights for the rank column: a title hit counts for more
+    # than a body hit
+    RANK = 'bm25(2.0, 1.0)'
+
+    def __init__(self, path: Path = SEARCH_INDEX_PATH, readonly: bool = False):
+        """Open the index, creating or rebuilding it for extract-sessions.py.
+
+        readonly opens an existing index for searching without ever writing
+        to it; a schema from another version raises RuntimeError instead of
+        being dropped.
+        """
+        if readonly:
+            self.db = sqlite3.connect(f'{path.resolve().as_uri()}?mode=ro', uri=True)
+            if self.db.execute('PRAGMA user_version').fetchone()[0] != SEARCH_INDEX_VERSION:
+                self.db.close()
+                raise RuntimeError(f"search index {path} is from another version, "
+                                   "re-run extract-sessions.py to rebuild it")
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(path)
+        if self.db.execute('PRAGMA user_version').fetchone()[0] != SEARCH_INDEX_VERSION:
+            self.db.executescript("""
+                DROP TABLE IF EXISTS messages_fts;
+                DROP TABLE IF EXISTS messages;
+            """)
+            self.db.execute(f'PRAGMA user_version = {SEARCH_INDEX_VERSION}')
+        self.db.executescript(self.SCHEMA)
+
+    def is_empty(self) -> bool:
+        return self.db.execute('SELECT 1 FROM messages LIMIT 1').fetchone() is None
+
+    def replace_session(self, path: str, session_id: str, title: str, messages: Iterable[dict]):
+        """Index a session's messages, replacing any rows for its markdown path."""
+        self.db.execute('DELETE FROM messages WHERE path = ?', (path,))
+        self.add_messages(path, session_id, title, messages)
+
+    def add_messages(self, path: str, session_id: str, title: str, messages: Iterable[dict]):
+        self.db.executemany(
+            'INSERT INTO messages (path, session_id, timestamp, title, content) VALUES (?, ?, ?, ?, ?)',
+            ((path, session_id, m['timestamp'] or '', title, m['content']) for m in messages),
+        )
+
+    def session_id(self, path: str) -> str | None:
+        row = self.db.execute('SELECT session_id FROM messages WHERE path = ? LIMIT 1', (path,)).fetchone()
+        return row[0] if row else None
+
+    def set_title(self, path: str, title: str):
+        self.db.execute('UPDATE messages SET title = ? WHERE path = ? AND title != ?', (title, path, title))
+
+    def search(self, query: str, limit: int = 10) -> list[dict]:
+        """Best-matching sessions for query, one row per session.
+
+        Each row carries the session's best message (timestamp, BM25 score,
+        highlighted snippet) and how many of its messages matched. Lower
+        scores are better, as in SQLite's bm25().
+        """
+        match = fts_query(query)
+        if not match:
+            return []
+        # Rank and count per session in SQL. bm25() can't sit inside an
+        # aggregate but the rank column can; with MIN(), the bare id column
+        # comes from the best-scoring message
+        best = self.db.execute(
+            'SELECT m.path, m.id, MIN(messages_fts.rank) AS best, COUNT(*) '
+            'FROM messages_fts JOIN messages m ON m.id = messages_fts.rowid '
+            'WHERE messages_fts MATCH ? AND messages_fts.rank MATCH ? '
+            'GROUP BY m.path ORDER BY best LIMIT ?',
+            (match, self.RANK, limit),
+        ).fetchall()
+        # Snippets only for the sessions returned
+        sessions = []
+        for path, rowid, score, hits in best:
+            session_id, timestamp, title, snippet = self.db.execute(
+                'SELECT m.session_id, m.timestamp, m.title, '
+                "snippet(messages_fts, 1, '[', ']', '...', 16) "
+                'FROM messages_fts JOIN messages m ON m.id = messages_fts.rowid '
+                'WHERE messages_fts MATCH ? AND messages_fts.rowid = ?',
+                (match, rowid),
+            ).fetchone()
+            sessions.append({
+                'session_id': session_id, 'title': title, 'timestamp': timestamp,
+                'score': round(score, 3), 'snippet': snippet, 'path': path, 'hits': hits,
+            })
+        return sessions
+
+    def close(self):
+        self.db.commit()
+        self.db.close()
+
+
+def qmd_search(query: str, collection: str, limit: int) -> list[dict]:
+    """Run `qmd search --json` against one collection.
+
+    qmd's JSON rows carry docid ("#abc123"), score, file (a
+    qmd://collection/path URI), title, an optional context and snippet.
+    Results are keyed by file, falling back to docid (both are accepted by
+    `qmd get`); rows with neither are dropped with a warning rather than
+    fused under an empty path.
+    """
+    proc = subprocess.run(
+        ['qmd', 'search', query, '-c', collection, '-n', str(limit), '--json'],
+        capture_output=True, text=True, timeout=60,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip() or f"qmd exited with {proc.returncode}")
+    results = []
+    dropped = 0
+    for r in json.loads(proc.stdout or '[]'):
+        path = r.get('file') or r.get('docid') if isinstance(r, dict) else None
+        if not path:
+            dropped += 1
+            continue
+        results.append({
+            'title': r.get('title') or Path(path).stem,
+            'snippet': r.get('snippet') or '',
+            'path': path,
+            'score': r.get('score'),
+        })
+    if dropped:
+        print(f"Warning: {dropped} qmd results in {collection} had no file or docid, skipped "
+              "(unexpected qmd --json format?)", file=sys.stderr)
+    return results
+
+
+def search_collection(query: str, collection: str, limit: int, index_path: Path) -> list[dict]:
+    """One query against one collection: the local FTS5 index or qmd."""
+    if collection == LOCAL_COLLECTION and index_path.exists():
+        index = MessageIndex(index_path, readonly=True)
+        try:
+            return index.search(query, limit)
+        finally:
+            index.close()
+    return qmd_search(query, collection, limit)
+
+
+def fuse_results(runs: list[tuple[str, str, list[dict]]], k: int = RRF_K) -> list[dict]:
+    """Merge ranked lists with reciprocal-rank fusion, deduped by path.
+
+    runs holds (query, collection, results) per search. A document scores
+    the sum of 1 / (k + rank) over every list it appears in, so documents
+    found by several query variants rise to the top. Each keeps the fields
+    (snippet, score) of its best-ranked appearance.
+    """
+    fused = {}
+    for query, collection, results in runs:
+        for rank, r in enumerate(results, 1):
+            hit = fused.get(r['path'])
+            if hit is None:
+                hit = fused[r['path']] = {**r, 'collection': collection, 'rrf': 0.0, 'queries': [], 'rank': rank}
+            elif rank < hit['rank']:
+                hit.update(r, rank=rank)
+            hit['rrf'] += 1 / (k + rank)
+            if query not in hit['queries']:
+                hit['queries'].append(query)
+    for hit in fused.values():
+        hit['rrf'] = round(hit['rrf'], 5)
+        del hit['rank']
+    return sorted(fused.values(), key=lambda h: -h['rrf'])
+
+
+def derive_title(first_user_msg: str | None) -> str:
+    """Derive a short title from the first user message."""
     title = "Untitled"
     if first_user_msg:
         first_line = first_user_msg.split('\n')[0].strip()
@@ -219,17 +742,431 @@ def scan_session_metadata(filepath: Path, date_start: datetime, date_end: dateti
             first_line = first_line[:77] + '...'
         if len(first_line) >= 3:
             title = first_line
+    return title
+
+
+def read_session_metadata(filepath: Path, date_start: datetime | None = None,
+                          date_end: datetime | None = None) -> dict | None:
+    """Parse a session file for metadata, count user messages.
+
+    The end time comes from read_end_time, which seeks back from EOF, so it
+    usually costs a block or two of extra I/O (up to the last timestamp,
+    when the file ends in one huge record). Also builds the activity timeline:
+    per UTC day, the first and last user-message timestamp and the number
+    of user messages.
+
+    With a date range, bails out early (returning None) if the session
+    started after the range. Without one, always reads the whole file, so
+    the result is date-independent and safe to cache.
+    """
+    session_id = filepath.stem
+    start_time = None
+    first_user_msg = None
+    user_msg_count = 0
+    activity = {}
+    file_size = filepath.stat().st_size
+
+    try:
+        with open(filepath, 'rb') as f:
+            for i, line in enumerate(f):
+                # Get session ID from data if available (the record's own,
+                # not one nested in a tool result)
+                m = SESSION_ID_RE.search(line, 0, record_head(line))
+                if m:
+                    session_id = m.group(1).decode()
+
+                # Prefilter: only decode lines that can set start_time or the
+                # first message. Assistant turns are never decoded (quotes in
+                # JSON strings are escaped, so a line without the user marker
+                # has no user key at any depth), and once both are known,
+                # unambiguous user turns (incl. multi-MB tool results) are
+                # counted from their byte markers alone.
+                is_user = USER_TYPE_RE.search(line) is not None
+                ts = None
+                if is_user and start_time and first_user_msg is not None:
+                    ts = user_message_timestamp(line)
+                if ts is not None:
+                    user_msg_count += 1
+                    if ts:
+                        add_activity(activity, ts)
+                elif is_user or (not start_time and TIMESTAMP_MARKER in line):
+                    try:
+                        obj = decode_record(line)
+                    except DECODE_ERRORS:
+                        continue
+
+                    ts_str = obj.get('timestamp')
+                    if ts_str and not start_time:
+                        try:
+                            start_time = datetime.fromisoformat(ts_str.replace('Z', '+00:00'))
+                        except (ValueError, TypeError, AttributeError):
+                            pass
+
+                    # Count user messages and capture first
+                    if is_user and obj.get('type') == 'user' and obj.get('message', {}).get('role') == 'user':
+                        user_msg_count += 1
+                        if ts_str:
+                            add_activity(activity, ts_str)
+                        if first_user_msg is None:
+                            raw = extract_text(obj['message'].get('content', ''))
+                            cleaned = clean_content(raw)
+                            if cleaned and len(cleaned) >= 5:
+                                # Skip pure slash commands
+                                if not re.match(r'^/\w+\s*$', cleaned):
+                                    first_user_msg = cleaned
+
+                # Early exit: a session that starts after the range can't be
+                # active in it. Earlier starts may have been resumed since.
+                if date_start and start_time and i < 5:
+                    if start_time >= date_end:
+                        return None
+
+    except (OSError, UnicodeDecodeError):
+        return None
+
+    # Sessions with no timestamped user messages are active on their start day
+    if not activity and start_time:
+        activity[day_key(start_time)] = [start_time, start_time, 0]
 
     return {
         'session_id': session_id,
         'start_time': start_time,
+        'end_time': read_end_time(filepath) or start_time,
         'user_msg_count': user_msg_count,
         'file_size': file_size,
-        'title': title,
+        'title': derive_title(first_user_msg),
         'filepath': str(filepath),
+        'activity': activity,
+    }
+
+
+def read_end_time(filepath: Path, block_size: int = 64 * 1024) -> datetime | None:
+    """Find the last record timestamp by reading blocks backwards from EOF.
+
+    Each block is regex-scanned as is, so a multi-MB last line costs one
+    read, not a rescan per block; blocks overlap by a few bytes so a key
+    split across two is still found. Returns the last parseable timestamp
+    key in the file, an unterminated final line included. That is normally
+    the last record's own: Claude Code writes it after the message, and
+    nested payloads rarely carry a "timestamp" key of their own.
+    """
+    overlap = 256
+    try:
+        with open(filepath, 'rb') as f:
+            pos = f.seek(0, os.SEEK_END)
+            tail = b''
+            while pos > 0:
+                step = min(block_size, pos)
+                pos -= step
+                f.seek(pos)
+                buf = f.read(step) + tail
+                for m in reversed(list(TIMESTAMP_RE.finditer(buf))):
+                    try:
+                        return datetime.fromisoformat(m.group(1).decode().replace('Z', '+00:00'))
+                    except ValueError:
+                        continue
+                tail = buf[:overlap]
+    except OSError:
+        pass
+    return None
+
+
+def day_key(dt: datetime) -> str:
+    """UTC day partition key for the activity timeline."""
+    return dt.astimezone(timezone.utc).strftime('%Y-%m-%d')
+
+
+def add_activity(activity: dict, ts_str: str):
+    """Record one user message at ts_str in a day -> [first, last, count] timeline."""
+    try:
+        ts = datetime.fromisoformat(ts_str.replace('Z', '+00:00'))
+    except (ValueError, TypeError, AttributeError):
+        return
+    day = activity.get(day_key(ts))
+    if day is None:
+        activity[day_key(ts)] = [ts, ts, 1]
+    else:
+        day[0] = min(day[0], ts)
+        day[1] = max(day[1], ts)
+        day[2] += 1
+
+
+def range_activity(meta: dict | None, date_start: datetime, date_end: datetime) -> dict | None:
+    """Summarize a session's activity within [date_start, date_end).
+
+    Returns first/last user-message time and message count in the range, or
+    None if the session wasn't active in it.
+    """
+    if meta is None or not meta['start_time']:
+        return None
+    lo, hi = day_key(date_start), day_key(date_end)
+    days = [v for day, v in meta['activity'].items() if lo <= day < hi]
+    if not days:
+        return None
+    return {
+        'first': min(d[0] for d in days),
+        'last': max(d[1] for d in days),
+        'msgs': sum(d[2] for d in days),
+    }
+
+
+def scan_session_metadata(filepath: Path, date_start: datetime, date_end: datetime,
+                          index: SessionIndex | None = None) -> dict | None:
+    """Get session metadata if the session was active within the date range.
+
+    Served from the index when the file is unchanged; otherwise the file is
+    parsed and, if it was read in full, the result is written back.
+    """
+    sessions = scan_sessions([filepath], date_start, date_end, index)
+    return sessions[0] if sessions else None
+
+
+def pool_workers(filepaths: list[Path], jobs: int, nbytes: int | None = None) -> int:
+    """Worker processes worth starting for filepaths, or 0 to stay serial.
+
+    nbytes is how much will be read, when that isn't the whole files (a
+    resumed session only reads what was appended).
+    """
+    if jobs <= 1 or len(filepaths) < 2:
+        return 0
+    if len(filepaths) < POOL_MIN_FILES:
+        size = nbytes or 0
+        for fp in filepaths if nbytes is None else ():
+            try:
+                size += fp.stat().st_size
+            except OSError:
+                pass
+        if size < POOL_MIN_BYTES:
+            return 0
+    return min(jobs, len(filepaths))
+
+
+def iter_sessions(filepaths: list[Path], date_start: datetime, date_end: datetime,
+                  index: SessionIndex | None = None, jobs: int = 1):
+    """Yield metadata for sessions active in the range as soon as each is known.
+
+    Index hits are resolved in this process first, and only sessions the
+    activity timeline shows in range are loaded. Misses are parsed across a
+    pool of `jobs` worker processes (when there are enough to be worth it,
+    see pool_workers) and yielded in completion order; they
+    are written back to the index here, so only one process ever touches the
+    database. Each result carries its in-range activity under 'active'.
+    """
+    pending = []
+    stats = {}
+    active = index.active_paths(date_start, date_end) if index is not None else None
+    for filepath in filepaths:
+        if index is not None:
+            try:
+                st = filepath.stat()
+            except OSError:
+                continue
+            if index.is_fresh(filepath, st):
+                if str(filepath) in active:
+                    meta = index.get(filepath, st)
+                    meta['active'] = range_activity(meta, date_start, date_end)
+                    if meta['active'] is not None:
+                        yield meta
+                continue
+            stats[filepath] = st
+        pending.append(filepath)
+
+    # With an index, read whole files so the result can be cached
+    if index is not None:
+        scan = read_session_metadata
+    else:
+        scan = functools.partial(read_session_metadata, date_start=date_start, date_end=date_end)
+
+    def finish(filepath, meta):
+        if meta is not None and index is not None:
+            index.put(filepath, stats[filepath], meta)
+        summary = range_activity(meta, date_start, date_end)
+        if summary is not None:
+            meta['active'] = summary
+            return meta
+        return None
+
+    workers = pool_workers(pending, jobs)
+    if workers:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        try:
+            futures = {pool.submit(scan, filepath): filepath for filepath in pending}
+            for future in as_completed(futures):
+                meta = finish(futures[future], future.result())
+                if meta is not None:
+                    yield meta
+        finally:
+            # Consumer may stop early - drop queued work instead of draining it
+            pool.shutdown(cancel_futures=True)
+    else:
+        for filepath in pending:
+            meta = finish(filepath, scan(filepath))
+            if meta is not None:
+                yield meta
+
+
+def scan_sessions(filepaths: list[Path], date_start: datetime, date_end: datetime,
+                  index: SessionIndex | None = None, jobs: int = 1) -> list[dict]:
+    """Scan many session files, returning those active in the range in input order."""
+    order = {str(fp): i for i, fp in enumerate(filepaths)}
+    sessions = list(iter_sessions(filepaths, date_start, date_end, index, jobs))
+    sessions.sort(key=lambda s: order[s['filepath']])
+    return sessions
+
+
+def grep_gate(pattern: str) -> re.Pattern | None:
+    """Byte regex that every raw JSONL line matching `pattern` must contain.
+
+    Only safe when JSON escaping can't change what the pattern sees: ASCII,
+    no quotes/backslashes, and no '.', '[', '^', '$' that could match or
+    anchor differently in the escaped form. Returns None otherwise.
+    """
+    if not pattern.isascii() or not pattern.isprintable():
+        return None
+    if any(c in pattern for c in '"\\.[^$'):
+        return None
+    return re.compile(pattern.encode(), re.IGNORECASE)
+
+
+def grep_session(filepath: Path, pattern: re.Pattern, gate: re.Pattern | None = None) -> bool:
+    """True if any user message in the session matches pattern.
+
+    Raw lines are tested against the byte gate before decoding, and reading
+    stops at the first confirmed hit.
+    """
+    try:
+        with open(filepath, 'rb') as f:
+            for line in f:
+                if not USER_TYPE_RE.search(line):
+                    continue
+                if gate is not None and not gate.search(line):
+                    continue
+                try:
+                    obj = decode_record(line)
+                except DECODE_ERRORS:
+                    continue
+                msg = obj.get('message', {})
+                if obj.get('type') != 'user' or msg.get('role') != 'user':
+                    continue
+                if pattern.search(clean_content(extract_text(msg.get('content', '')))):
+                    return True
+    except (OSError, UnicodeDecodeError):
+        pass
+    return False
+
+
+def grep_sessions(filepaths: list[Path], pattern: str, jobs: int = 1) -> list[bool]:
+    """Match many sessions against a case-insensitive pattern, in input order."""
+    grep = functools.partial(grep_session, pattern=re.compile(pattern, re.IGNORECASE),
+                             gate=grep_gate(pattern))
+    workers = pool_workers(filepaths, jobs)
+    if workers:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(grep, filepaths, chunksize=max(1, len(filepaths) // (workers * 4))))
+    return [grep(fp) for fp in filepaths]
+
+
+def visible_user_text(msg: dict) -> str | None:
+    """Cleaned text of a user message as expand shows it, or None for noise."""
+    cleaned = clean_content(extract_text(msg.get('content', '')))
+    if not cleaned or len(cleaned) < 5:
+        return None
+    if re.match(r'^/\w+\s*$', cleaned):
+        return None
+    return cleaned
+
+
+def scan_message_offsets(filepath: Path, start: int = 0) -> tuple[list[int], int]:
+    """Byte offsets of the user messages expand would show, reading from start.
+
+    Returns the offsets and the position after the last complete record, so
+    a growing session can be resumed from there.
+    """
+    offsets = []
+    pos = start
+    with open(filepath, 'rb') as f:
+        f.seek(start)
+        for line in f:
+            if not line.endswith(b'\n'):
+                # A last line that doesn't parse is still being written
+                try:
+                    decode_record(line)
+                except DECODE_ERRORS:
+                    break
+            if USER_TYPE_RE.search(line):
+                try:
+                    obj = decode_record(line)
+                except DECODE_ERRORS:
+                    obj = None
+                if obj and obj.get('type') == 'user':
+                    msg = obj.get('message', {})
+                    if msg.get('role') == 'user' and visible_user_text(msg):
+                        offsets.append(pos)
+            pos += len(line)
+    return offsets, pos
+
+
+def list_session_files(proj_dir: Path, index: SessionIndex | None = None) -> list[Path]:
+    """Session JSONL files in a project directory."""
+    if index is not None:
+        return index.project_files(proj_dir)
+    return list(proj_dir.glob("*.jsonl"))
+
+
+def _match_session_files(proj_dir: Path, prefix: str) -> list[Path]:
+    """Session files in a project directory whose ID starts with prefix."""
+    return [fp for fp in proj_dir.glob("*.jsonl") if fp.stem.lower().startswith(prefix)]
+
+
+def find_session_files(project_dirs: list[Path], prefix: str,
+                       index: SessionIndex | None = None) -> list[Path]:
+    """Find all session files matching an ID prefix.
+
+    Uses the index when available; otherwise globs every project directory.
+    """
+    if index is not None:
+        return index.find_prefix(prefix, project_dirs)
+    return [fp for proj_dir in project_dirs for fp in _match_session_files(proj_dir, prefix)]
+
+
+def session_window(meta: dict, date_start: datetime, date_end: datetime) -> tuple[datetime, datetime]:
+    """First and last activity of a session within the range.
+
+    The end is the session's own end time if it falls inside the range,
+    otherwise its last user message in the range.
+    """
+    first = meta['active']['first']
+    end = meta['end_time'] if meta['end_time'] and meta['end_time'] < date_end else meta['active']['last']
+    return first, max(end, first)
+
+
+def session_record(meta: dict, date_start: datetime, date_end: datetime) -> dict:
+    """JSON-serializable row for --format ndjson/json."""
+    first, end = session_window(meta, date_start, date_end)
+    return {
+        'session_id': meta['session_id'],
+        'start_time': meta['start_time'].isoformat(),
+        'end_time': meta['end_time'].isoformat() if meta['end_time'] else None,
+        'active_start': first.isoformat(),
+        'active_end': end.isoformat(),
+        'duration_min': int((end - first).total_seconds() // 60),
+        'msgs': meta['active']['msgs'],
+        'user_msg_count': meta['user_msg_count'],
+        'resumed': meta['start_time'] < date_start,
+        'file_size': meta['file_size'],
+        'title': meta['title'],
+        'filepath': meta['filepath'],
     }
 
 
+def format_duration(delta: timedelta) -> str:
+    """Format a duration compactly (e.g. 45m, 2h05m)."""
+    minutes = max(int(delta.total_seconds() // 60), 0)
+    if minutes < 60:
+        return f"{minutes}m"
+    return f"{minutes // 60}h{minutes % 60:02d}m"
+
+
 def format_size(size_bytes: int) -> str:
     """Format file size human-readable."""
     if size_bytes < 1024:
@@ -243,14 +1180,22 @@ def format_size(size_bytes: int) -> str:
 def cmd_list(args):
     """List sessions for a date range."""
     date_start, date_end = parse_date_expr(args.date_expr)
+    if args.grep:
+        try:
+            re.compile(args.grep)
+        except re.error as e:
+            print(f"Error: Invalid --grep pattern '{args.grep}': {e}", file=sys.stderr)
+            sys.exit(1)
     project_dirs = get_project_dirs(args.project, args.all_projects)
+    index = open_index(not args.no_cache)
 
     sessions = []
     noise_count = 0
     total_scanned = 0
+    candidates = []
 
     for proj_dir in project_dirs:
-        jsonl_files = list(proj_dir.glob("*.jsonl"))
+        jsonl_files = list_session_files(proj_dir, index)
         total_scanned += len(jsonl_files)
 
         for filepath in jsonl_files:
@@ -261,18 +1206,53 @@ def cmd_list(args):
                     continue
             except OSError:
                 continue
+            candidates.append(filepath)
 
-            meta = scan_session_metadata(filepath, date_start, date_end)
-            if meta is None:
-                continue
+    grep_count = 0
+    pattern = re.compile(args.grep, re.IGNORECASE) if args.grep else None
+    gate = grep_gate(args.grep) if args.grep else None
 
-            if meta['user_msg_count'] < args.min_msgs:
-                noise_count += 1
-                continue
+    # Stream rows as files are scanned; filters are applied per session
+    if args.format == 'ndjson' and not args.sort:
+        try:
+            for meta in iter_sessions(candidates, date_start, date_end, index, args.jobs):
+                if meta['active']['msgs'] < args.min_msgs:
+                    continue
+                if pattern and not grep_session(Path(meta['filepath']), pattern, gate):
+                    continue
+                print(json.dumps(session_record(meta, date_start, date_end)), flush=True)
+        except BrokenPipeError:
+            # Reader stopped early - silence the flush at interpreter exit
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        finally:
+            if index is not None:
+                index.close()
+        return
+
+    for meta in scan_sessions(candidates, date_start, date_end, index, args.jobs):
+        if meta['active']['msgs'] < args.min_msgs:
+            noise_count += 1
+            continue
+
+        sessions.append(meta)
 
-            sessions.append(meta)
+    if index is not None:
+        index.close()
 
-    sessions.sort(key=lambda s: s['start_time'])
+    if args.grep:
+        hits = grep_sessions([Path(s['filepath']) for s in sessions], args.grep, args.jobs)
+        grep_count = hits.count(False)
+        sessions = [s for s, hit in zip(sessions, hits) if hit]
+
+    sessions.sort(key=lambda s: s['active']['first'])
+
+    if args.format == 'ndjson':
+        for s in sessions:
+            print(json.dumps(session_record(s, date_start, date_end)))
+        return
+    if args.format == 'json':
+        print(json.dumps([session_record(s, date_start, date_end) for s in sessions], indent=2))
+        return
 
     # Format date range for header
     if date_end - date_start <= timedelta(days=1):
@@ -286,22 +1266,36 @@ def cmd_list(args):
         print("No sessions found.")
         if noise_count:
             print(f"({noise_count} filtered as noise, try --min-msgs 1)")
+        if grep_count:
+            print(f"({grep_count} did not match --grep '{args.grep}')")
         return
 
     # Print table
-    print(f" {'#':>2}  {'Time':5}  {'Msgs':>4}  {'Size':>6}  First Message")
-    print(f" {'--':>2}  {'-----':5}  {'----':>4}  {'------':>6}  -------------")
+    print(f" {'#':>2}  {'Time':5}  {'End':5}  {'Dur':>6}  {'Msgs':>4}  {'Size':>6}  First Message")
+    print(f" {'--':>2}  {'-----':5}  {'-----':5}  {'------':>6}  {'----':>4}  {'------':>6}  -------------")
 
+    # Time, End, Dur and Msgs describe activity within the range; sessions
+    # resumed from an earlier day are marked with their start date
+    resumed = 0
     for i, s in enumerate(sessions, 1):
-        time_str = s['start_time'].strftime('%H:%M')
+        first, end = session_window(s, date_start, date_end)
+        time_str = first.strftime('%H:%M')
+        end_str = end.strftime('%H:%M')
+        dur_str = format_duration(end - first)
         size_str = format_size(s['file_size'])
         title = s['title'][:60]
-        sid_short = s['session_id'][:8]
-        print(f" {i:2}  {time_str}  {s['user_msg_count']:4}  {size_str:>6}  {title}")
+        if s['start_time'] < date_start:
+            resumed += 1
+            title = f"(cont. {s['start_time'].strftime('%m-%d')}) {title}"[:60]
+        print(f" {i:2}  {time_str}  {end_str}  {dur_str:>6}  {s['active']['msgs']:4}  {size_str:>6}  {title}")
 
     print(f"\n{len(sessions)} sessions", end="")
+    if resumed:
+        print(f", {resumed} resumed from earlier days", end="")
     if noise_count:
         print(f" ({noise_count} filtered as noise)", end="")
+    if grep_count:
+        print(f" ({grep_count} did not match --grep)", end="")
     print()
 
     # Print session IDs for expand
@@ -316,31 +1310,54 @@ def cmd_expand(args):
     target_id = args.session_id.lower()
 
     # Find the JSONL file
-    target_file = None
-    for proj_dir in project_dirs:
-        for filepath in proj_dir.glob("*.jsonl"):
-            if filepath.stem.lower().startswith(target_id):
-                target_file = filepath
-                break
-        if target_file:
-            break
-
-    if not target_file:
-        print(f"Error: No session found matching '{args.session_id}'", file=sys.stderr)
-        sys.exit(1)
+    index = open_index(not args.no_cache)
+    try:
+        matches = find_session_files(project_dirs, target_id, index)
+
+        if not matches:
+            print(f"Error: No session found matching '{args.session_id}'", file=sys.stderr)
+            sys.exit(1)
+
+        if len(matches) > 1:
+            print(f"Error: '{args.session_id}' is ambiguous, matches {len(matches)} sessions:", file=sys.stderr)
+            for fp in matches:
+                print(f"  {fp.stem}  ({fp.parent.name})", file=sys.stderr)
+            sys.exit(1)
+
+        target_file = matches[0]
+
+        # Seek straight to the requested page via the offset index
+        from_msg = max(args.from_msg, 1)
+        start_offset = 0
+        total = None
+        if from_msg > 1:
+            if index is not None:
+                start_offset, total = index.message_offset(target_file, from_msg)
+            else:
+                offsets, _ = scan_message_offsets(target_file)
+                total = len(offsets)
+                start_offset = offsets[from_msg - 1] if from_msg <= total else None
+            if start_offset is None:
+                print(f"Error: --from-msg {from_msg} is past the end ({total} user messages)", file=sys.stderr)
+                sys.exit(1)
+    finally:
+        if index is not None:
+            index.close()
 
     print(f"\nSession: {target_file.stem}")
     print(f"File: {target_file}")
     print()
 
-    msg_count = 0
+    msg_count = from_msg - 1
+    last_shown = msg_count
     max_msgs = args.max_msgs
 
-    with open(target_file) as f:
+    with open(target_file, 'rb') as f:
+        f.seek(start_offset)
         for line in f:
             try:
-                obj = json.loads(line)
-            except json.JSONDecodeError:
+                obj = decode_record(line)
+            except DECODE_ERRORS:
                 continue
 
             msg_type = obj.get('type')
@@ -358,16 +1375,14 @@ def cmd_expand(args):
                     pass
 
             if msg_type == 'user' and role == 'user':
-                raw = extract_text(msg.get('content', ''))
-                cleaned = clean_content(raw)
-                if not cleaned or len(cleaned) < 5:
-                    continue
-                if re.match(r'^/\w+\s*$', cleaned):
+                cleaned = visible_user_text(msg)
+                if cleaned is None:
                     continue
 
                 msg_count += 1
-                if max_msgs and msg_count > max_msgs:
-                    print(f"\n... truncated at {max_msgs} messages (use --max-msgs to show more)")
+                if max_msgs and msg_count - from_msg >= max_msgs:
+                    print(f"\n... truncated at {max_msgs} messages "
+                          f"(use --max-msgs to show more, --from-msg {msg_count} for the next page)")
                     break
 
                 # Truncate long messages
@@ -377,6 +1392,7 @@ def cmd_expand(args):
                 display = display.replace('\n', '\n    ')
 
                 print(f"[{ts_label}] USER: {display}")
+                last_shown = msg_count
 
             elif msg_type == 'assistant' and role == 'assistant':
                 content = msg.get('content', [])
@@ -393,7 +1409,71 @@ def cmd_expand(args):
                                 tool_name = block.get('name', '?')
                                 print(f"  [{ts_label}] TOOL: {tool_name}")
 
-    print(f"\n{msg_count} user messages total")
+    if total is None:
+        print(f"\n{msg_count} user messages total")
+    else:
+        print(f"\nMessages {from_msg}-{last_shown} of {total}")
+
+
+def cmd_search(args):
+    """Search query variants across collections in one pass, fused with RRF."""
+    collections = [c for spec in args.collection for c in spec.split(',') if c] or [LOCAL_COLLECTION]
+    index_path = Path(args.index)
+    has_qmd = shutil.which('qmd') is not None
+
+    searchable = []
+    for collection in dict.fromkeys(collections):
+        if collection == LOCAL_COLLECTION and index_path.exists():
+            searchable.append(collection)
+        elif has_qmd:
+            searchable.append(collection)
+        elif collection == LOCAL_COLLECTION:
+            print(f"Warning: no search index at {index_path} (run extract-sessions.py) and qmd not found",
+                  file=sys.stderr)
+        else:
+            print(f"Warning: qmd not found, skipping collection '{collection}'", file=sys.stderr)
+    if not searchable:
+        sys.exit(1)
+
+    tasks = [(query, collection) for collection in searchable for query in args.query]
+    runs = []
+    with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+        futures = {pool.submit(search_collection, q, c, args.per_query, index_path): (q, c) for q, c in tasks}
+        for future in as_completed(futures):
+            query, collection = futures[future]
+            try:
+                runs.append((query, collection, future.result()))
+            except (RuntimeError, ValueError, OSError, sqlite3.Error, subprocess.SubprocessError) as e:
+                print(f"Warning: search '{query}' in {collection} failed: {e}", file=sys.stderr)
+    # Completion order varies; fuse in a fixed order so ties break the same way
+    order = {task: i for i, task in enumerate(tasks)}
+    runs.sort(key=lambda run: order[run[:2]])
+    results = fuse_results(runs)[:args.limit]
+
+    if args.format == 'ndjson':
+        for r in results:
+            print(json.dumps(r))
+        return
+    if args.format == 'json':
+        print(json.dumps(results, indent=2))
+        return
+
+    if not results:
+        print(f"No results for {' / '.join(args.query)}.")
+        return
+
+    for i, r in enumerate(results, 1):
+        when = ''
+        if r.get('timestamp'):
+            try:
+                when = datetime.fromisoformat(r['timestamp'].replace('Z', '+00:00')).strftime('%Y-%m-%d %H:%M  ')
+            except ValueError:
+                pass
+        matched = f"{len(r['queries'])}/{len(args.query)} queries"
+        print(f" {i:2}. [{r['collection']}] {when}{r['title'][:60]}  ({matched}, rrf {r['rrf']:.4f})")
+        if r['snippet']:
+            print(f"     {' '.join(r['snippet'].split())[:200]}")
+        print(f"     {r['path']}")
 
 
 def main():
@@ -410,6 +1490,12 @@ def main():
     p_list.add_argument('--project', help='Project path to scan')
     p_list.add_argument('--all-projects', action='store_true', help='Scan all projects')
     p_list.add_argument('--min-msgs', type=int, default=3, help='Min user messages (default: 3)')
+    p_list.add_argument('--grep', metavar='PATTERN', help='Only sessions whose user messages match PATTERN (regex, case-insensitive)')
+    p_list.add_argument('--format', choices=['table', 'ndjson', 'json'], default='table',
+                        help='Output format (default: table). ndjson streams rows as sessions are scanned')
+    p_list.add_argument('--sort', action='store_true', help='With --format ndjson, buffer and emit rows sorted by time')
+    p_list.add_argument('--no-cache', action='store_true', help='Bypass the session metadata index')
+    p_list.add_argument('--jobs', type=int, default=DEFAULT_JOBS, help=f'Parallel scan workers (default: {DEFAULT_JOBS})')
 
     # expand
     p_expand = sub.add_parser('expand', help='Expand a session by ID')
@@ -417,6 +1503,22 @@ def main():
     p_expand.add_argument('--project', help='Project path to scan')
     p_expand.add_argument('--all-projects', action='store_true', help='Scan all projects')
     p_expand.add_argument('--max-msgs', type=int, default=50, help='Max messages to show (default: 50)')
+    p_expand.add_argument('--from-msg', type=int, default=1, help='First user message to show (default: 1)')
+    p_expand.add_argument('--no-cache', action='store_true', help='Bypass the session index')
+
+    # search
+    p_search = sub.add_parser('search', help='Search query variants across collections (BM25 + rank fusion)')
+    p_search.add_argument('query', nargs='+', help='One or more query variants (BM25 ranked, any word may match)')
+    p_search.add_argument('-c', '--collection', action='append', default=[],
+                          help=f"Collection(s), repeatable or comma-separated (default: {LOCAL_COLLECTION}). "
+                               f"'{LOCAL_COLLECTION}' uses the local index, others go through qmd")
+    p_search.add_argument('-n', '--limit', type=int, default=10, help='Max results after fusion (default: 10)')
+    p_search.add_argument('--per-query', type=int, default=10,
+                          help='Results taken from each variant x collection search (default: 10)')
+    p_search.add_argument('--format', choices=['table', 'ndjson', 'json'], default='table',
+                          help='Output format (default: table)')
+    p_search.add_argument('--index', default=str(SEARCH_INDEX_PATH),
+                          help=f'Search index path (default: {SEARCH_INDEX_PATH})')
 
     args = parser.parse_args()
 
@@ -426,6 +1528,8 @@ def main():
         cmd_list(args)
     elif args.command == 'expand':
         cmd_expand(args)
+    elif args.command == 'search':
+        cmd_search(args)
 
 
 if __name__ == '__main__':
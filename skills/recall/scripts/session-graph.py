@@ -2,7 +2,8 @@
 """Build a temporal graph of sessions and files touched, visualize with pyvis.
 
 Usage:
-    session-graph.py DATE_EXPR [--min-msgs N] [--min-files N] [--day DAY] [--no-open]
+    session-graph.py DATE_EXPR [--min-msgs N] [--min-files N] [--day DAY] [--no-open] [--no-cache]
+                     [--jobs N]
 
 DATE_EXPR: same as recall-day.py (yesterday, "last week", 2026-02-25, etc.)
 --day: filter to specific day within range (e.g. "monday", "2026-02-20")
@@ -10,14 +11,28 @@ DATE_EXPR: same as recall-day.py (yesterday, "last week", 2026-02-25, etc.)
 Outputs interactive HTML to /tmp/session-graph.html and opens in browser.
 Features: Obsidian-style theme, neighbor highlighting on hover, click-to-select
 nodes, copy selected file paths to clipboard.
+
+Each session's files and metadata are cached in cache/graph.db (next to
+recall-day's index), keyed by path + size + mtime + vault roots, so re-rendering
+a range only re-reads sessions that changed. Those are read across --jobs
+worker processes (default: CPU count) when there are enough to be worth it.
+
+Files are attributed to the detected vault (VAULT_DIR or the enclosing
+.obsidian folder). To graph several vaults, e.g. with --all-projects, list
+the others in RECALL_VAULTS (os.pathsep-separated); their files appear under
+a folder named after each vault.
 """
 
+import functools
+import hashlib
 import json
 import os
 import re
+import sqlite3
 import subprocess
 import sys
 from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
@@ -44,6 +59,40 @@ def _detect_vault_prefix():
     return str(cwd) + "/"
 
 VAULT_PREFIX = _detect_vault_prefix()
+
+
+def _vault_roots() -> dict[str, str]:
+    """Map vault prefix -> label prepended to its relative paths.
+
+    The detected vault keeps bare relative paths; extra roots listed in
+    RECALL_VAULTS (os.pathsep-separated) are labelled by directory name.
+    """
+    roots = {VAULT_PREFIX: ''}
+    labels = set()
+    for p in os.environ.get("RECALL_VAULTS", "").split(os.pathsep):
+        if not p.strip():
+            continue
+        prefix = str(Path(p).expanduser()).rstrip('/') + '/'
+        if prefix in roots:
+            continue
+        name = Path(prefix).name
+        label, n = name, 1
+        while label in labels:
+            n += 1
+            label = f"{name}-{n}"
+        labels.add(label)
+        roots[prefix] = label + '/'
+    return roots
+
+
+VAULT_ROOTS = _vault_roots()
+# Cache key for anything derived from path normalization: a hash of every
+# root and its label, so adding, removing or renaming a vault misses
+VAULT_KEY = hashlib.sha1(json.dumps(sorted(VAULT_ROOTS.items())).encode()).hexdigest()[:16]
+TOUCH_CACHE_PATH = recall_day.CACHE_DIR / "graph.db"
+# Bump when the cached fields or path normalization change
+TOUCH_CACHE_VERSION = 4
+decode_record = recall_day.record_decoder('sessionId', 'timestamp', 'type', 'message')
 SKIP_PREFIXES = ["/tmp/", "/private/tmp/", "/dev/", "/var/", "/usr/"]
 SKIP_PATTERNS = [
     re.compile(r'\.claude/projects/'),
@@ -52,10 +101,22 @@ SKIP_PATTERNS = [
     re.compile(r'__pycache__/'),
     re.compile(r'\.DS_Store'),
 ]
-
+SKIP_RE = re.compile('|'.join(pat.pattern for pat in SKIP_PATTERNS))
+SKIP_SUFFIXES = ('.png', '.jpg', '.jpeg', '.gif', '.mp4', '.mp3', '.wav',
+                 '.zip', '.tar', '.gz', '.pdf', '.excalidraw', '.json',
+                 '.har', '.css', '.ico')
+# Characters a Bash path runs over, up to a delimiter
+PATH_CHARS = r'[^\s"\';<>|&\)]'
+# Longest root first, so a nested vault wins over the one containing it
 FILE_PATH_RE = re.compile(
-    r'(?:^|[\s"\'=])(' + re.escape(VAULT_PREFIX) + r'[^\s"\';<>|&\)]+)',
+    r'(?:^|[\s"\'=])((?:' + '|'.join(re.escape(p) for p in sorted(VAULT_ROOTS, key=len, reverse=True))
+    + r')' + PATH_CHARS + '+)',
 )
+PATH_TAIL_RE = re.compile(PATH_CHARS + '*')
+# Chars past a vault root the path regex first looks at; a match that
+# reaches the edge is extended to the end of its token
+BASH_SCAN_WINDOW = 4096
+ROOT_MAX = max(len(p) for p in VAULT_ROOTS)
 
 # Obsidian-inspired palette
 DAY_COLORS = {
@@ -109,41 +170,162 @@ NOISE_FILES = {
     ".claude/settings.local.json",
 }
 
+NOISE_PATHS = {label + f for label in VAULT_ROOTS.values() for f in NOISE_FILES}
 
-def extract_file_paths(jsonl_path: Path) -> dict | None:
-    """Extract all file paths from tool calls in a JSONL session file."""
-    files = set()
-    ops = defaultdict(set)
+def graph_title(first_user_msg: str | None) -> str:
+    """Short node title from the first user message."""
+    title = "Untitled"
+    if first_user_msg:
+        first_line = first_user_msg.split('\n')[0].strip()
+        first_line = re.sub(r'^#+\s*', '', first_line)
+        # Clean up "Continue:" prefix
+        m = re.match(r'Continue:\s*(.+)', first_line)
+        if m:
+            first_line = m.group(1).strip()
+        if len(first_line) > 50:
+            first_line = first_line[:47] + '...'
+        if len(first_line) >= 3:
+            title = first_line
+    return title
+
+
+def collect_touches(block: dict, touches: set, stats: Counter | None = None):
+    """Add the raw (path, op) pairs of one tool_use block to touches."""
+    tool = block.get('name', '')
+    inp = block.get('input', {})
+    if not isinstance(inp, dict):
+        return
+
+    if tool in ('Read', 'Edit', 'Write', 'NotebookEdit'):
+        fp = inp.get('file_path') or inp.get('notebook_path', '')
+        if fp:
+            touches.add((fp, tool.lower()))
+
+    elif tool in ('Glob', 'Grep'):
+        fp = inp.get('path', '')
+        if fp:
+            touches.add((fp, 'search'))
+
+    elif tool == 'Bash':
+        cmd = inp.get('command', '')
+        if not isinstance(cmd, str):
+            return
+        for fp in bash_paths(cmd, stats):
+            touches.add((fp.rstrip('.,;:'), 'bash'))
+
+
+def bash_paths(cmd: str, stats: Counter | None = None):
+    """Yield vault paths in a Bash command, as FILE_PATH_RE.finditer would.
+
+    Commands that never mention a vault root (heredoc scripts, pipelines
+    over /tmp) are skipped with a substring test, and the regex only runs
+    in a BASH_SCAN_WINDOW after each root occurrence (stretched to the end
+    of a path that runs past it), so long commands cost a few str.find
+    calls. stats counts commands, chars, chars the
+    regex scanned and commands skipped.
+    """
+    hits = sorted({i for root in VAULT_ROOTS for i in _find_all(cmd, root)})
+    if stats is not None:
+        stats['commands'] += 1
+        stats['chars'] += len(cmd)
+        if not hits:
+            stats['skipped'] += 1
+    pos = 0
+    for i in hits:
+        if i < pos:
+            continue
+        # Start on the delimiter before the root, which the pattern consumes
+        start = max(i - 1, 0)
+        end = min(len(cmd), i + ROOT_MAX + BASH_SCAN_WINDOW)
+        m = FILE_PATH_RE.search(cmd, start, end)
+        if m and m.end() == end < len(cmd):
+            # The window cut the path short: rescan up to the end of its token
+            end = PATH_TAIL_RE.match(cmd, end).end()
+            m = FILE_PATH_RE.search(cmd, start, end)
+        if stats is not None:
+            stats['scanned'] += (m.end() if m else end) - start
+        if m:
+            pos = m.end()
+            yield m.group(1)
+
+
+def _find_all(text: str, sub: str):
+    i = text.find(sub)
+    while i >= 0:
+        yield i
+        i = text.find(sub, i + 1)
+
+
+def extract_file_paths(jsonl_path: Path, date_start: datetime | None = None,
+                       date_end: datetime | None = None, min_msgs: int = 0) -> dict | None:
+    """Extract session metadata and all file paths from tool calls, in one pass.
+
+    Uses recall-day's byte prefilter: only lines that can set the start
+    time or the title, and assistant turns with tool calls, are decoded;
+    other user turns are counted from their markers. With a date range,
+    sessions that did not start in it bail out at the first timestamp and
+    come back with only their start time and msg_count None; check user
+    activity with session_in_range(). Paths are
+    collected raw and only normalized once the session has min_msgs user
+    messages, so filtered sessions skip that work and come back with no
+    files and 'resolved' unset.
+    """
+    touches = set()
     session_id = jsonl_path.stem
     start_time = None
     first_user_msg = None
     user_msg_count = 0
+    # UTC days with user messages, from timestamp prefixes
+    days = set()
+    bash_stats = Counter()
 
     try:
-        with open(jsonl_path) as f:
+        with open(jsonl_path, 'rb') as f:
             for line in f:
+                m = recall_day.SESSION_ID_RE.search(line, 0, recall_day.record_head(line))
+                if m:
+                    session_id = m.group(1).decode()
+
+                is_user = recall_day.USER_TYPE_RE.search(line) is not None
+                if is_user and start_time and first_user_msg is not None:
+                    ts = recall_day.user_message_timestamp(line)
+                    if ts is not None:
+                        user_msg_count += 1
+                        if ts:
+                            days.add(ts[:10])
+                        continue
+
+                if not (is_user or b'"tool_use"' in line or (not start_time and recall_day.TIMESTAMP_MARKER in line)):
+                    continue
                 try:
-                    obj = json.loads(line)
-                except json.JSONDecodeError:
+                    obj = decode_record(line)
+                except recall_day.DECODE_ERRORS:
                     continue
 
-                if obj.get('sessionId'):
-                    session_id = obj['sessionId']
-
                 ts_str = obj.get('timestamp')
                 if ts_str and not start_time:
                     try:
                         start_time = datetime.fromisoformat(ts_str.replace('Z', '+00:00'))
-                    except (ValueError, TypeError):
+                    except (ValueError, TypeError, AttributeError):
                         pass
-
-                if obj.get('type') == 'user':
-                    user_msg_count += 1
+                    else:
+                        # Only sessions that started in the range are graphed
+                        if date_start and not (date_start <= start_time < date_end):
+                            return {'session_id': session_id, 'start_time': start_time,
+                                    'filepath': str(jsonl_path), 'msg_count': None}
+
+                if is_user and obj.get('type') == 'user':
+                    message = obj.get('message', {})
+                    if message.get('role') == 'user':
+                        user_msg_count += 1
+                        if ts_str:
+                            days.add(ts_str[:10])
                     if first_user_msg is None:
-                        raw = recall_day.extract_text(obj.get('message', {}).get('content', ''))
+                        raw = recall_day.extract_text(message.get('content', ''))
                         cleaned = recall_day.clean_content(raw)
                         if cleaned and len(cleaned) >= 5:
                             first_user_msg = cleaned
+                    continue
 
                 if obj.get('type') != 'assistant':
                     continue
@@ -153,101 +335,201 @@ def extract_file_paths(jsonl_path: Path) -> dict | None:
                     continue
 
                 for block in content:
-                    if not isinstance(block, dict) or block.get('type') != 'tool_use':
-                        continue
-
-                    tool = block.get('name', '')
-                    inp = block.get('input', {})
-
-                    if tool in ('Read', 'Edit', 'Write', 'NotebookEdit'):
-                        fp = inp.get('file_path') or inp.get('notebook_path', '')
-                        if fp:
-                            norm = normalize_path(fp)
-                            if norm:
-                                files.add(norm)
-                                ops[norm].add(tool.lower())
-
-                    elif tool in ('Glob', 'Grep'):
-                        fp = inp.get('path', '')
-                        if fp:
-                            norm = normalize_path(fp)
-                            if norm:
-                                files.add(norm)
-                                ops[norm].add('search')
-
-                    elif tool == 'Bash':
-                        cmd = inp.get('command', '')
-                        for m in FILE_PATH_RE.finditer(cmd):
-                            fp = m.group(1).rstrip('.,;:')
-                            norm = normalize_path(fp)
-                            if norm:
-                                files.add(norm)
-                                ops[norm].add('bash')
-
+                    if isinstance(block, dict) and block.get('type') == 'tool_use':
+                        collect_touches(block, touches, bash_stats)
     except (OSError, UnicodeDecodeError):
         return None
-
     if not start_time:
         return None
 
+    files = set()
+    ops = defaultdict(set)
+    resolved = user_msg_count >= min_msgs
+    if resolved:
+        for fp, op in touches:
+            norm = normalize_path(fp)
+            if norm:
+                files.add(norm)
+                ops[norm].add(op)
     # Strip noise files
-    files -= NOISE_FILES
-
-    title = "Untitled"
-    if first_user_msg:
-        first_line = first_user_msg.split('\n')[0].strip()
-        first_line = re.sub(r'^#+\s*', '', first_line)
-        # Clean up "Continue:" prefix
-        m = re.match(r'Continue:\s*(.+)', first_line)
-        if m:
-            first_line = m.group(1).strip()
-        if len(first_line) > 50:
-            first_line = first_line[:47] + '...'
-        if len(first_line) >= 3:
-            title = first_line
-
+    files -= NOISE_PATHS
     return {
         'files': files,
         'ops': dict(ops),
         'session_id': session_id,
         'start_time': start_time,
-        'title': title,
+        'title': graph_title(first_user_msg),
         'msg_count': user_msg_count,
         'filepath': str(jsonl_path),
+        'days': sorted(days),
+        'resolved': resolved,
+        'bash': dict(bash_stats),
     }
 
 
-def normalize_path(fp: str) -> str | None:
-    """Normalize a file path to vault-relative, skip irrelevant paths."""
-    if not fp or not fp.startswith('/'):
-        return None
+def session_in_range(session: dict, date_start: datetime, date_end: datetime) -> bool:
+    """Started in [date_start, date_end) and had user messages in it.
 
-    for prefix in SKIP_PREFIXES:
-        if fp.startswith(prefix):
-            return None
+    Sessions without timestamped user messages count as active on their
+    start day.
+    """
+    if not (date_start <= session['start_time'] < date_end):
+        return False
+    if not session['days']:
+        return True
+    lo, hi = recall_day.day_key(date_start), recall_day.day_key(date_end)
+    return any(lo <= day < hi for day in session['days'])
+
+
+class TouchCache:
+    """Persistent per-session graph data, keyed by path + size + mtime + vaults.
+
+    Stores what extract_file_paths found (metadata, active days, normalized
+    file touches), so re-rendering a range only re-reads sessions that
+    changed. Sessions read for a range they did not start in are stored
+    with just their start time (msg_count NULL), so later runs skip them
+    without reading until a range includes that start. Touches depend on
+    the vault roots, so a row only hits for the exact set of roots and
+    labels it was built with (VAULT_KEY). Lives next to recall-day's
+    session index.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS touches (
+            path TEXT PRIMARY KEY,
+            size INTEGER NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            vault TEXT NOT NULL,
+            session_id TEXT NOT NULL,
+            start_time TEXT NOT NULL,
+            title TEXT NOT NULL,
+            msg_count INTEGER,
+            days TEXT NOT NULL,
+            ops TEXT
+        );
+    """
 
-    for pat in SKIP_PATTERNS:
-        if pat.search(fp):
+    def __init__(self, path: Path = TOUCH_CACHE_PATH):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(path)
+        if self.db.execute('PRAGMA user_version').fetchone()[0] != TOUCH_CACHE_VERSION:
+            self.db.execute('DROP TABLE IF EXISTS touches')
+            self.db.execute(f'PRAGMA user_version = {TOUCH_CACHE_VERSION}')
+        self.db.executescript(self.SCHEMA)
+
+    def get(self, filepath: Path, st: os.stat_result) -> dict | None:
+        """Cached session if the file is unchanged and the vault is the same."""
+        row = self.db.execute(
+            'SELECT session_id, start_time, title, msg_count, days, ops FROM touches '
+            'WHERE path = ? AND size = ? AND mtime_ns = ? AND vault = ?',
+            (str(filepath), st.st_size, st.st_mtime_ns, VAULT_KEY),
+        ).fetchone()
+        if row is None:
             return None
+        session_id, start_time, title, msg_count, days, ops = row
+        ops = {fp: set(o) for fp, o in json.loads(ops).items()} if ops is not None else {}
+        return {
+            'files': set(ops) - NOISE_PATHS,
+            'ops': ops,
+            'session_id': session_id,
+            'start_time': datetime.fromisoformat(start_time),
+            'title': title,
+            'msg_count': msg_count,
+            'filepath': str(filepath),
+            'days': json.loads(days),
+            'resolved': row[5] is not None,
+        }
+
+    def put(self, filepath: Path, st: os.stat_result, session: dict):
+        if session['msg_count'] is None:
+            title, days, ops = '', '[]', None
+        else:
+            title, days = session['title'], json.dumps(session['days'])
+            ops = json.dumps({fp: sorted(o) for fp, o in session['ops'].items()}) if session['resolved'] else None
+        self.db.execute(
+            'INSERT OR REPLACE INTO touches VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (str(filepath), st.st_size, st.st_mtime_ns, VAULT_KEY, session['session_id'],
+             session['start_time'].isoformat(), title, session['msg_count'], days, ops),
+        )
+
+    def close(self):
+        self.db.commit()
+        self.db.close()
+
+
+class PathTrie:
+    """Path-component trie over vault roots and skipped prefixes.
+
+    lookup() walks a path once and returns (label, relative path) for the
+    deepest vault root containing it, or None when no root matches or a
+    skipped prefix comes first.
+    """
+
+    SKIP = object()
+
+    def __init__(self, roots: dict[str, str], skip_prefixes: list[str]):
+        self.root = {}
+        for prefix, label in roots.items():
+            self._insert(prefix, label)
+        for prefix in skip_prefixes:
+            self._insert(prefix, self.SKIP)
+
+    def _insert(self, prefix: str, value):
+        node = self.root
+        for part in prefix.strip('/').split('/'):
+            node = node.setdefault(part, {})
+        # An explicit skip on the same node takes precedence, as before
+        if node.get(None) is not self.SKIP:
+            node[None] = value
+
+    def lookup(self, fp: str) -> tuple[str, str] | None:
+        node = self.root
+        found = None
+        start = 1
+        while True:
+            end = fp.find('/', start)
+            if end < 0:
+                return found
+            node = node.get(fp[start:end])
+            if node is None:
+                return found
+            start = end + 1
+            value = node.get(None)
+            if value is self.SKIP:
+                return None
+            if value is not None:
+                found = (value, fp[start:])
+
+
+VAULT_TRIE = PathTrie(VAULT_ROOTS, SKIP_PREFIXES)
+
+
+@functools.lru_cache(maxsize=65536)
+def normalize_path(fp: str) -> str | None:
+    """Normalize a file path to vault-relative, skip irrelevant paths.
 
-    if not fp.startswith(VAULT_PREFIX):
+    Paths in extra vaults (RECALL_VAULTS) come back prefixed with their
+    vault label. Memoized: sessions touch the same few hundred paths.
+    """
+    if not fp or not fp.startswith('/'):
         return None
 
-    rel = fp[len(VAULT_PREFIX):]
-    if not rel:
+    match = VAULT_TRIE.lookup(fp)
+    if match is None:
+        return None
+    label, rel = match
+    if not rel or SKIP_RE.search(fp):
         return None
 
     # Skip binary/media/config noise
-    if rel.endswith(('.png', '.jpg', '.jpeg', '.gif', '.mp4', '.mp3', '.wav',
-                     '.zip', '.tar', '.gz', '.pdf', '.excalidraw', '.json',
-                     '.har', '.css', '.ico')):
+    if rel.endswith(SKIP_SUFFIXES):
         return None
 
     # Skip if it's just a directory path (no extension, no filename)
-    if '.' not in rel.split('/')[-1]:
+    if '.' not in rel.rpartition('/')[2]:
         return None
 
-    return rel
+    return label + rel
 
 
 def get_folder_color(path: str) -> str:
@@ -1128,6 +1410,83 @@ def build_custom_js(date_label: str, sessions_meta: dict) -> str:
     """
 
 
+def collect_sessions(project_dirs: list[Path], date_start: datetime, date_end: datetime,
+                     min_msgs: int, cache: TouchCache | None = None, jobs: int = 1) -> tuple[list, int]:
+    """Sessions that started in the range with at least min_msgs user messages.
+
+    Unchanged sessions come from the cache, and those cached as starting
+    outside the range are skipped unread. The rest are read across `jobs`
+    worker processes when there are enough of them (see
+    recall_day.pool_workers) and cached here, so only this process writes
+    the database. Results are consumed in file order whatever the job count.
+    Returns (sessions, skipped), skipped counting those under min_msgs.
+    """
+    candidates = []
+    misses = []
+    for proj_dir in project_dirs:
+        for filepath in sorted(proj_dir.glob("*.jsonl")):
+            try:
+                st = filepath.stat()
+                mtime = datetime.fromtimestamp(st.st_mtime, tz=timezone.utc)
+                if mtime < date_start - timedelta(days=1):
+                    continue
+            except OSError:
+                continue
+
+            result = cache.get(filepath, st) if cache is not None else None
+            if result is not None and result['msg_count'] is None:
+                # Only the start time is cached
+                if not (date_start <= result['start_time'] < date_end):
+                    continue
+                result = None
+            # A row cached below an earlier --min-msgs has no files resolved
+            if result is None or (not result['resolved'] and result['msg_count'] >= min_msgs):
+                result = None
+                misses.append(filepath)
+            candidates.append((filepath, st, result))
+
+    scan = functools.partial(extract_file_paths, date_start=date_start, date_end=date_end, min_msgs=min_msgs)
+    pool = None
+    workers = recall_day.pool_workers(misses, jobs)
+    if workers:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        scanned = pool.map(scan, misses, chunksize=max(1, len(misses) // (workers * 4)))
+    else:
+        scanned = map(scan, misses)
+
+    sessions = []
+    skipped = 0
+    done = 0
+    bash_stats = Counter()
+    try:
+        for filepath, st, result in candidates:
+            if result is None:
+                done += 1
+                print(f"  Scanning {done}/{len(misses)} {filepath.stem[:8]}...", end='\r')
+                result = next(scanned)
+                if result is None:
+                    continue
+                if cache is not None:
+                    cache.put(filepath, st, result)
+                if result['msg_count'] is None:
+                    continue
+                bash_stats.update(result['bash'])
+            if not session_in_range(result, date_start, date_end):
+                continue
+            if result['msg_count'] < min_msgs:
+                skipped += 1
+                continue
+            sessions.append(result)
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    if bash_stats['commands']:
+        print(f"\n  Bash: {bash_stats['commands']} commands, {bash_stats['skipped']} without a vault path skipped, "
+              f"regex over {bash_stats['scanned'] / 1e6:.1f} of {bash_stats['chars'] / 1e6:.1f}MB")
+    return sessions, skipped
+
+
 def filter_sessions_by_day(sessions: list, day_filter: str) -> list:
     """Filter sessions to a specific day within the range."""
     day_filter = day_filter.strip().lower()
@@ -1158,6 +1517,9 @@ def main():
     parser.add_argument('--day', type=str, default=None, help='Filter to specific day (e.g. monday, 2026-02-20)')
     parser.add_argument('--all-projects', action='store_true')
     parser.add_argument('--no-open', action='store_true', help='Do not open browser')
+    parser.add_argument('--no-cache', action='store_true', help='Bypass the per-session touch cache')
+    parser.add_argument('--jobs', type=int, default=recall_day.DEFAULT_JOBS,
+                        help=f'Parallel scan workers (default: {recall_day.DEFAULT_JOBS})')
     parser.add_argument('-o', '--output', default=None)
 
     args = parser.parse_args()
@@ -1174,31 +1536,15 @@ def main():
 
     project_dirs = recall_day.get_project_dirs(None, args.all_projects)
 
-    sessions = []
-    skipped = 0
-
-    for proj_dir in project_dirs:
-        for filepath in proj_dir.glob("*.jsonl"):
-            try:
-                mtime = datetime.fromtimestamp(filepath.stat().st_mtime, tz=timezone.utc)
-                if mtime < date_start - timedelta(days=1):
-                    continue
-            except OSError:
-                continue
-
-            meta = recall_day.scan_session_metadata(filepath, date_start, date_end)
-            if meta is None:
-                continue
-
-            if meta['user_msg_count'] < args.min_msgs:
-                skipped += 1
-                continue
-
-            print(f"  Scanning {filepath.stem[:8]}...", end='\r')
-            result = extract_file_paths(filepath)
-            if result and result['start_time'] >= date_start and result['start_time'] < date_end:
-                sessions.append(result)
-
+    cache = None
+    if not args.no_cache:
+        try:
+            cache = TouchCache()
+        except (OSError, sqlite3.Error) as e:
+            print(f"Warning: touch cache unavailable ({e}), scanning without cache", file=sys.stderr)
+    sessions, skipped = collect_sessions(project_dirs, date_start, date_end, args.min_msgs, cache, args.jobs)
+    if cache is not None:
+        cache.close()
     sessions.sort(key=lambda s: s['start_time'])
 
     if args.day: